@@ -1,4 +1,6 @@
 #!/usr/bin/env python
+import sys
+
 from addict import Dict
 
 from manimlib import __version__
@@ -57,6 +59,11 @@ def main():
         return
     if args.clear_cache:
         clear_cache()
+    if args.benchmark is not None:
+        from manimlib.benchmarks.runner import run_benchmark_suite
+        if not run_benchmark_suite(args.benchmark, args.baseline):
+            sys.exit(1)
+        return
 
     run_scenes()
 
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from copy import deepcopy
 
+import numpy as np
+
 from manimlib.mobject.mobject import _AnimationBuilder
 from manimlib.mobject.mobject import Mobject
 from manimlib.utils.iterables import remove_list_redundancies
@@ -88,7 +90,7 @@ class Animation(object):
 
     def create_starting_mobject(self) -> Mobject:
         # Keep track of where the mobject starts
-        return self.mobject.copy()
+        return self.mobject.copy(share_data=True)
 
     def get_all_mobjects(self) -> tuple[Mobject, Mobject]:
         """
@@ -181,6 +183,25 @@ class Animation(object):
         raw_sub_alpha = clip((value - lower), 0, 1)
         return self.rate_func(raw_sub_alpha)
 
+    def get_sub_alphas(self, alpha: float, num_submobjects: int) -> np.ndarray:
+        """
+        Equivalent to get_sub_alpha for every index at once
+        """
+        lag_ratio = self.lag_ratio
+        full_length = (num_submobjects - 1) * lag_ratio + 1
+        lowers = lag_ratio * np.arange(num_submobjects)
+        raw_sub_alphas = np.clip(alpha * full_length - lowers, 0, 1)
+        # Many submobjects share a value, typically 0 or 1, and rate
+        # functions with branches cannot be applied to arrays directly
+        values, inverse = np.unique(raw_sub_alphas, return_inverse=True)
+        try:
+            rated = np.asarray(self.rate_func(values), dtype=float)
+        except (TypeError, ValueError):
+            rated = None
+        if rated is None or rated.shape != values.shape:
+            rated = np.array([self.rate_func(value) for value in values], dtype=float)
+        return rated[inverse]
+
     # Getters and setters
     def set_run_time(self, run_time: float):
         self.run_time = run_time
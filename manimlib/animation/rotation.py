@@ -45,6 +45,7 @@ class Rotating(Animation):
             self.starting_mobject.family_members_with_points(),
         )
         for sm1, sm2 in pairs:
+            sm1.own_data()
             for key in sm1.pointlike_data_keys:
                 sm1.data[key][:] = sm2.data[key]
         self.mobject.rotate(
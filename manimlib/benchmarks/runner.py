@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from manimlib import __version__
+from manimlib.benchmarks import scenes
+from manimlib.benchmarks.scenes import BENCHMARK_SCENES
+from manimlib.config import manim_config
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+# Relative change beyond which a metric counts as a regression
+DEFAULT_TOLERANCE = 0.1
+# For each metric compared against a baseline, whether larger values are better
+COMPARED_METRICS = {
+    "construction_time": False,
+    "fps": True,
+    "peak_rss_mb": False,
+}
+
+
+def get_peak_rss_mb() -> float:
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, and in kilobytes elsewhere
+    if sys.platform == "darwin":
+        return peak / 2**20
+    return peak / 2**10
+
+
+def run_benchmark(
+    scene_name: str,
+    output_directory: str,
+    resolution: tuple[int, int] = (1280, 720),
+    fps: int = 30,
+) -> dict[str, Any]:
+    """
+    Render one scene from manimlib.benchmarks.scenes to a movie file,
+    offscreen, and measure it. This is meant to run in a fresh process,
+    so that the peak memory reflects this scene alone.
+    """
+    start = time.perf_counter()
+    scene = getattr(scenes, scene_name)(
+        camera_config=dict(resolution=resolution, fps=fps),
+        file_writer_config=dict(
+            write_to_movie=True,
+            subdivide_output=False,
+            save_last_frame=False,
+            output_directory=output_directory,
+            file_name=scene_name,
+            open_file_upon_completion=False,
+            show_file_location_upon_completion=False,
+            quiet=True,
+        ),
+    )
+    scene.run()
+    total_time = time.perf_counter() - start
+
+    movie_path = scene.file_writer.get_movie_file_path()
+    return dict(
+        total_time=total_time,
+        construction_time=total_time - scene.render_time,
+        render_time=scene.render_time,
+        n_frames=scene.n_frames,
+        fps=scene.n_frames / scene.render_time if scene.render_time else 0.0,
+        peak_rss_mb=get_peak_rss_mb(),
+        bytes_written=os.path.getsize(movie_path),
+    )
+
+
+def run_benchmarks(
+    scene_names: list[str],
+    resolution: tuple[int, int] = (1280, 720),
+    fps: int = 30,
+) -> dict[str, Any]:
+    # Spawn rather than fork, so that each scene gets a fresh
+    # OpenGL context and its own peak memory
+    mp_context = multiprocessing.get_context("spawn")
+    results = dict()
+    with tempfile.TemporaryDirectory() as output_directory:
+        for name in scene_names:
+            with ProcessPoolExecutor(1, mp_context=mp_context) as executor:
+                future = executor.submit(run_benchmark, name, output_directory, resolution, fps)
+                results[name] = future.result()
+            print(format_result(name, results[name]))
+
+    return dict(
+        version=__version__,
+        python=platform.python_version(),
+        platform=platform.platform(),
+        resolution=list(resolution),
+        fps=fps,
+        timestamp=time.time(),
+        results=results,
+    )
+
+
+def compare_to_baseline(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[dict[str, Any]]:
+    """
+    Return the metrics of scenes in both runs which are worse than
+    in the baseline by more than the given relative tolerance
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        base_result = baseline["results"].get(name)
+        if base_result is None:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            value = result[metric]
+            base_value = base_result.get(metric)
+            if not base_value:
+                continue
+            change = (value - base_value) / base_value
+            if (-change if higher_is_better else change) > tolerance:
+                regressions.append(dict(
+                    scene=name,
+                    metric=metric,
+                    baseline=base_value,
+                    current=value,
+                    change=change,
+                ))
+    return regressions
+
+
+def format_result(name: str, result: dict[str, Any]) -> str:
+    return (
+        f"{name:<32}"
+        f"construct {result['construction_time']:7.2f}s  "
+        f"{result['fps']:7.1f} fps  "
+        f"{result['peak_rss_mb']:7.0f} MB  "
+        f"{result['bytes_written'] / 2**20:6.2f} MB written"
+    )
+
+
+def format_regression(regression: dict[str, Any]) -> str:
+    return (
+        f"{regression['scene']}: {regression['metric']} went from "
+        f"{regression['baseline']:.3g} to {regression['current']:.3g} "
+        f"({regression['change']:+.0%})"
+    )
+
+
+def run_benchmark_suite(
+    output_path: str | None = None,
+    baseline_path: str | None = None,
+    scene_names: list[str] | None = None,
+) -> bool:
+    """
+    Run the benchmarks at the resolution and frame rate of the global
+    camera configuration, optionally writing the results to output_path
+    and comparing them against those in baseline_path. Returns whether
+    no regressions were found.
+    """
+    if scene_names is None:
+        scene_names = [scene_class.__name__ for scene_class in BENCHMARK_SCENES]
+    camera_config = manim_config.camera
+    results = run_benchmarks(scene_names, tuple(camera_config.resolution), camera_config.fps)
+
+    if output_path:
+        with open(output_path, "w") as fp:
+            json.dump(results, fp, indent=2)
+
+    if not baseline_path:
+        return True
+    with open(baseline_path) as fp:
+        baseline = json.load(fp)
+    regressions = compare_to_baseline(results, baseline)
+    for regression in regressions:
+        print("Regression: " + format_regression(regression))
+    if not regressions:
+        print(f"No regressions against {baseline_path}")
+    return not regressions
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from manimlib.animation.creation import ShowCreation
+from manimlib.animation.creation import Write
+from manimlib.animation.fading import FadeIn
+from manimlib.animation.rotation import Rotate
+from manimlib.animation.transform import Transform
+from manimlib.animation.transform_matching_parts import TransformMatchingTex
+from manimlib.constants import BLUE, GREEN, RED, YELLOW, TEAL
+from manimlib.constants import DEG, DOWN, FRAME_WIDTH, IN, ORIGIN, OUT, PI, RIGHT, UP
+from manimlib.mobject.coordinate_systems import NumberPlane
+from manimlib.mobject.geometry import Dot
+from manimlib.mobject.geometry import Line
+from manimlib.mobject.geometry import Square
+from manimlib.mobject.svg.tex_mobject import Tex
+from manimlib.mobject.three_dimensions import Sphere
+from manimlib.mobject.three_dimensions import SurfaceMesh
+from manimlib.mobject.three_dimensions import Torus
+from manimlib.mobject.types.dot_cloud import DotCloud
+from manimlib.mobject.types.vectorized_mobject import VGroup
+from manimlib.mobject.value_tracker import ValueTracker
+from manimlib.scene.scene import Scene
+from manimlib.scene.scene import ThreeDScene
+
+
+class BenchmarkScene(Scene):
+    """
+    Records how many frames it writes, and how much time is spent
+    in play and wait calls, as opposed to building mobjects
+    """
+    random_seed = 0
+
+    def setup(self):
+        self.render_time = 0.0
+        self.n_frames = 0
+
+    def play(self, *args, **kwargs):
+        start = time.perf_counter()
+        super().play(*args, **kwargs)
+        self.render_time += time.perf_counter() - start
+
+    def wait(self, *args, **kwargs):
+        start = time.perf_counter()
+        super().wait(*args, **kwargs)
+        self.render_time += time.perf_counter() - start
+
+    def emit_frame(self) -> None:
+        if not self.skip_animations and not self.suppress_frame_output:
+            self.n_frames += 1
+        super().emit_frame()
+
+
+class ManyVMobjectsBenchmark(BenchmarkScene):
+    def construct(self):
+        squares = VGroup(*(Square(side_length=0.1) for n in range(3000)))
+        squares.arrange_in_grid(50, 60, buff=0.03)
+        squares.set_stroke(width=1)
+        squares.set_fill(opacity=0.5)
+        squares.set_submobject_colors_by_gradient(BLUE, GREEN)
+
+        self.play(ShowCreation(squares, lag_ratio=0.01), run_time=2)
+        self.play(Rotate(squares, PI / 2), run_time=2)
+        self.play(squares.animate.scale(0.5).set_color(RED), run_time=2)
+
+
+class TexBenchmark(BenchmarkScene):
+    def construct(self):
+        equations = VGroup(*(
+            Tex(Rf"\int_0^{{{n}}} x^{{{n}}} \, dx = \frac{{{n}^{{{n + 1}}}}}{{{n + 1}}}")
+            for n in range(1, 41)
+        ))
+        equations.arrange_in_grid(8, 5)
+        equations.set_width(FRAME_WIDTH - 1)
+
+        self.play(Write(equations), run_time=3)
+        self.play(equations.animate.set_color(YELLOW), run_time=1)
+
+
+class SurfaceBenchmark(BenchmarkScene, ThreeDScene):
+    def construct(self):
+        sphere = Sphere(radius=2)
+        torus = Torus(r1=2, r2=0.5)
+        for surface in [sphere, torus]:
+            surface.shift(IN)
+            surface.mesh = SurfaceMesh(surface)
+            surface.mesh.set_stroke(BLUE, 1, opacity=0.5)
+
+        self.play(FadeIn(sphere), ShowCreation(sphere.mesh, lag_ratio=0.01), run_time=2)
+        self.play(
+            Transform(sphere, torus),
+            Transform(sphere.mesh, torus.mesh),
+            self.frame.animate.increment_theta(-30 * DEG),
+            run_time=3,
+        )
+
+
+class DotCloudBenchmark(BenchmarkScene):
+    def construct(self):
+        points = np.random.uniform(-4, 4, (100_000, 3))
+        points[:, 2] = 0
+        cloud = DotCloud(points, radius=0.01)
+        cloud.set_color_by_gradient(BLUE, TEAL, GREEN)
+
+        self.play(FadeIn(cloud), run_time=1)
+        self.play(Rotate(cloud, PI / 2, axis=OUT), run_time=3)
+
+
+class UpdaterBenchmark(BenchmarkScene):
+    def construct(self):
+        tracker = ValueTracker(0)
+        dots = VGroup(*(Dot(radius=0.04) for n in range(400)))
+        angles = np.linspace(0, 2 * PI, len(dots), endpoint=False)
+        for dot, angle in zip(dots, angles):
+            dot.add_updater(lambda m, a=angle: m.move_to(
+                (2 + np.sin(5 * a + tracker.get_value())) * (np.cos(a) * RIGHT + np.sin(a) * UP)
+            ))
+        lines = VGroup(*(Line(DOWN, UP) for n in range(100)))
+        lines.add_updater(lambda m: [
+            line.put_start_and_end_on(dots[4 * n].get_center(), dots[4 * n + 2].get_center())
+            for n, line in enumerate(m)
+        ])
+        self.add(dots, lines)
+
+        self.play(tracker.animate.set_value(4 * PI), run_time=4)
+
+
+class TransformMatchingTexBenchmark(BenchmarkScene):
+    def construct(self):
+        kw = dict(t2c={"A": BLUE, "B": TEAL, "C": GREEN})
+        lines = [
+            Tex("A^2 + B^2 = C^2", **kw),
+            Tex("A^2 = C^2 - B^2", **kw),
+            Tex("A^2 = (C + B)(C - B)", **kw),
+            Tex(R"A = \sqrt{(C + B)(C - B)}", **kw),
+        ]
+        for line in lines:
+            line.scale(1.5)
+
+        self.add(lines[0])
+        for line1, line2 in zip(lines, lines[1:]):
+            self.play(TransformMatchingTex(line1, line2), run_time=1)
+            self.wait(0.5)
+
+
+class TexTransformBenchmark(BenchmarkScene):
+    def construct(self):
+        # Glyphs with very different numbers of curves, so that
+        # aligning their points is much of each Transform's work
+        tex_strings = [
+            R"\sum_{n=1}^\infty \frac{1}{n^2} = \frac{\pi^2}{6}",
+            R"\int_{-\infty}^\infty e^{-x^2} \, dx = \sqrt{\pi}",
+            R"\zeta(s) = \prod_{p \text{ prime}} \frac{1}{1 - p^{-s}}",
+        ]
+        groups = [
+            VGroup(*(Tex(tex_string) for n in range(24)))
+            for tex_string in tex_strings
+        ]
+        for group in groups:
+            group.arrange_in_grid(6, 4)
+            group.set_width(FRAME_WIDTH - 1)
+
+        self.add(groups[0])
+        for group in groups[1:]:
+            self.play(Transform(groups[0], group), run_time=1)
+
+
+class PackedNumberPlaneBenchmark(BenchmarkScene):
+    def construct(self):
+        # A large, static background drawn from packed family
+        # data, under a small mobject that moves every frame
+        plane = NumberPlane(faded_line_ratio=10)
+        plane.use_packed_family_data()
+        dot = Dot(color=YELLOW)
+        self.add(plane, dot)
+
+        self.play(dot.animate.move_to(4 * RIGHT + 2 * UP), run_time=2)
+        self.play(Rotate(dot, 2 * PI, about_point=ORIGIN), run_time=2)
+
+
+BENCHMARK_SCENES = [
+    ManyVMobjectsBenchmark,
+    TexBenchmark,
+    SurfaceBenchmark,
+    DotCloudBenchmark,
+    UpdaterBenchmark,
+    TransformMatchingTexBenchmark,
+    TexTransformBenchmark,
+    PackedNumberPlaneBenchmark,
+]
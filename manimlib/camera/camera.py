@@ -5,6 +5,8 @@
 
 from __future__ import annotations
 
+from collections import deque
+
 import moderngl
 import numpy as np
 import OpenGL.GL as gl
@@ -18,6 +20,7 @@ from manimlib.constants import FRAME_WIDTH
 from manimlib.mobject.mobject import Mobject
 from manimlib.mobject.mobject import Point
 from manimlib.utils.color import color_to_rgba
+from manimlib.utils.profiling import profiler
 
 from typing import TYPE_CHECKING
 
@@ -52,6 +55,14 @@ class Camera(object):
         # without multisampling, for 3d scenes one might want
         # to set samples to be greater than 0.
         samples: int = 0,
+        # When positive, frames written to file are read back from the
+        # GPU asynchronously through a ring of this many pixel buffers,
+        # so that the transfer of one frame overlaps rendering the next
+        n_readback_buffers: int = 0,
+        # When True, the leading render groups which are not changing get
+        # rendered once into an offscreen buffer, which is then copied into
+        # each frame, rather than drawing them again every frame
+        cache_static_layer: bool = False,
     ):
         self.window = window
         self.background_image = background_image
@@ -63,6 +74,8 @@ class Camera(object):
         self.pixel_array_dtype = pixel_array_dtype
         self.light_source_position = light_source_position
         self.samples = samples
+        self.n_readback_buffers = n_readback_buffers
+        self.cache_static_layer = cache_static_layer
 
         self.rgb_max_val: float = np.iinfo(self.pixel_array_dtype).max
         self.background_rgba: list[float] = list(color_to_rgba(
@@ -72,6 +85,8 @@ class Camera(object):
         self.init_frame(**frame_config)
         self.init_context()
         self.init_fbo()
+        self.init_readback_buffers()
+        self.init_static_layer()
         self.init_light_source()
 
     def init_frame(self, **config) -> None:
@@ -102,6 +117,20 @@ class Camera(object):
 
         self.fbo.use()
 
+    def init_readback_buffers(self) -> None:
+        width, height = self.default_pixel_shape
+        self.readback_buffers: list[moderngl.Buffer] = [
+            self.ctx.buffer(reserve=width * height * self.n_channels)
+            for _ in range(self.n_readback_buffers)
+        ]
+        self.readback_index: int = 0
+        self.pending_readbacks: deque[moderngl.Buffer] = deque()
+
+    def init_static_layer(self) -> None:
+        self.static_layer_fbo: Optional[moderngl.Framebuffer] = None
+        self.static_layer_mobjects: list[Mobject] = []
+        self.static_layer_state: Optional[tuple] = None
+
     def init_light_source(self) -> None:
         self.light_source = Point(self.light_source_position)
 
@@ -165,6 +194,42 @@ class Camera(object):
             dtype=dtype,
         )
 
+    def uses_async_readback(self) -> bool:
+        return len(self.readback_buffers) > 0
+
+    def queue_raw_fbo_data(self) -> Optional[bytes]:
+        """@brief 异步读取当前帧，并返回最早完成读取的一帧。
+        @details 将当前帧拷贝到非多采样缓冲后，发起写入像素缓冲环的异步读取；环已满时先取出最早排队的帧。
+        未启用异步读取时等价于 `get_raw_fbo_data`。返回 None 表示暂无可写出的帧。
+        """
+        if not self.uses_async_readback():
+            return self.get_raw_fbo_data()
+
+        ready = None
+        if len(self.pending_readbacks) == len(self.readback_buffers):
+            ready = self.pending_readbacks.popleft().read()
+
+        buffer = self.readback_buffers[self.readback_index]
+        self.readback_index = (self.readback_index + 1) % len(self.readback_buffers)
+        self.blit(self.fbo, self.draw_fbo)
+        self.draw_fbo.read_into(
+            buffer,
+            viewport=self.draw_fbo.viewport,
+            components=self.n_channels,
+            dtype='f1',
+        )
+        self.pending_readbacks.append(buffer)
+        return ready
+
+    def flush_raw_fbo_data(self) -> list[bytes]:
+        """@brief 取出所有仍在排队的异步读取帧。
+        @details 按入队顺序返回像素数据，应在关闭视频管道前调用，以保证输出帧数与同步读取一致。
+        """
+        frames = [buffer.read() for buffer in self.pending_readbacks]
+        self.pending_readbacks.clear()
+        self.readback_index = 0
+        return frames
+
     def get_image(self) -> Image.Image:
         """@brief 获取当前帧的 Pillow 图像对象。
         @details 适合在保存静帧或调试时调用，会自动读取像素并转换为 RGBA 图像。
@@ -250,11 +315,13 @@ class Camera(object):
     def capture(self, *mobjects: Mobject) -> None:
         """@brief 捕获场景中的 Mobject 并渲染到当前 FBO。
         @details 会按顺序清空颜色缓冲、刷新相机 uniform，再遍历传入的 Mobject 调用其 `render`，最后若绑定窗口则在屏幕上交换缓冲。
+        启用 `cache_static_layer` 时，开头连续的静态 Mobject 改为从缓存的离屏缓冲拷贝。
         """
         self.clear()
         self.refresh_uniforms()
         self.fbo.use()
-        for mobject in mobjects:
+        n_static = self.composite_static_layer(mobjects)
+        for mobject in mobjects[n_static:]:
             mobject.render(self.ctx, self.uniforms)
 
         if self.window:
@@ -263,6 +330,67 @@ class Camera(object):
                 self.blit(self.fbo, self.window_fbo)
                 self.window.swap_buffers()
 
+    def get_num_static_mobjects(self, mobjects: tuple[Mobject, ...]) -> int:
+        """
+        Number of leading mobjects which have no updaters, are not being
+        animated, and have not had their data noted as changed since they
+        were last rendered. Only a leading run can be rendered ahead of
+        time, since later mobjects are drawn on top of earlier ones.
+        """
+        n_static = 0
+        for mobject in mobjects:
+            if mobject._data_has_changed or mobject.is_changing():
+                break
+            n_static += 1
+        return n_static
+
+    def composite_static_layer(self, mobjects: tuple[Mobject, ...]) -> int:
+        """
+        If cache_static_layer is set, copy the leading static mobjects into
+        the current frame buffer from the static layer, rendering that layer
+        again first if its mobjects, the camera uniforms or the background
+        differ from when it was last rendered. Returns how many mobjects
+        were drawn this way.
+        """
+        # Depth can only be copied between buffers of matching formats
+        if not self.cache_static_layer or self.fbo is not self.fbo_for_files:
+            return 0
+        n_static = self.get_num_static_mobjects(mobjects)
+        if n_static == 0:
+            self.static_layer_mobjects = []
+            return 0
+
+        static_mobjects = list(mobjects[:n_static])
+        state = (dict(self.uniforms), tuple(self.background_rgba))
+        is_current = (
+            len(static_mobjects) == len(self.static_layer_mobjects)
+            and all(m1 is m2 for m1, m2 in zip(static_mobjects, self.static_layer_mobjects))
+            and state == self.static_layer_state
+        )
+        if not is_current:
+            self.render_static_layer(static_mobjects)
+            self.static_layer_state = state
+
+        gl.glBindFramebuffer(gl.GL_READ_FRAMEBUFFER, self.static_layer_fbo.glo)
+        gl.glBindFramebuffer(gl.GL_DRAW_FRAMEBUFFER, self.fbo.glo)
+        gl.glBlitFramebuffer(
+            *self.static_layer_fbo.viewport,
+            *self.fbo.viewport,
+            gl.GL_COLOR_BUFFER_BIT | gl.GL_DEPTH_BUFFER_BIT, gl.GL_NEAREST
+        )
+        self.fbo.use()
+        return n_static
+
+    def render_static_layer(self, mobjects: list[Mobject]) -> None:
+        if self.static_layer_fbo is None:
+            self.static_layer_fbo = self.get_fbo(self.samples)
+        self.static_layer_fbo.clear(*self.background_rgba)
+        self.static_layer_fbo.use()
+        for mobject in mobjects:
+            mobject.render(self.ctx, self.uniforms)
+        self.static_layer_mobjects = mobjects
+        profiler.count("static_layer_renders")
+
     def refresh_uniforms(self) -> None:
         """@brief 更新相机相关 shader uniform。
         @details 计算视图矩阵、帧缩放以及光源位置等信息，写入当前帧批次共享的 uniform 字典。
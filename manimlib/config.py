@@ -47,6 +47,7 @@ def initialize_manim_config() -> Dict:
     update_scene_config(config, args)
     update_run_config(config, args)
     update_embed_config(config, args)
+    update_profiling_config(config, args)
 
     return config
 
@@ -161,6 +162,13 @@ def parse_cli():
                  "in two comma separated values, e.g. \"3,6\", it will end " + \
                  "the rendering at the second value",
         )
+        parser.add_argument(
+            "--checkpoints",
+            action="store_true",
+            help="Save the scene state at the start of each animation, and when " + \
+                 "starting from a later animation with -n, restore its saved " + \
+                 "state instead of skipping through the earlier ones",
+        )
         parser.add_argument(
             "-e", "--embed",
             metavar="LINE_NUMBER",
@@ -196,6 +204,20 @@ def parse_cli():
             help="Calculate total framecount, to display in a progress bar, by doing " + \
                  "an initial run of the scene which skips animations."
         )
+        parser.add_argument(
+            "--parallel",
+            metavar="N",
+            type=int,
+            default=1,
+            help="Split the scene at its play calls and render the pieces " + \
+                 "in N separate processes, then join them into one movie",
+        )
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="Time each stage of rendering, log a summary at the end of " + \
+                 "each scene, and write a timeline viewable in chrome://tracing",
+        )
         parser.add_argument(
             "--video_dir",
             help="Directory to write video",
@@ -204,6 +226,20 @@ def parse_cli():
             "--config_file",
             help="Path to the custom configuration file",
         )
+        parser.add_argument(
+            "--benchmark",
+            nargs="?",
+            const="",
+            metavar="PATH",
+            help="Render the scenes in manimlib/benchmarks offscreen, print how " + \
+                 "they perform, and write the results as json to PATH if given",
+        )
+        parser.add_argument(
+            "--baseline",
+            metavar="PATH",
+            help="With --benchmark, compare against results written by an " + \
+                 "earlier run, exiting with status 1 if any regressed",
+        )
         parser.add_argument(
             "-v", "--version",
             action="store_true",
@@ -310,6 +346,8 @@ def update_scene_config(config: Dict, args: Namespace):
         scene_config.leave_progress_bars = True
     if args.show_animation_progress:
         scene_config.show_animation_progress = True
+    if args.checkpoints:
+        scene_config.use_play_checkpoints = True
 
 
 def update_run_config(config: Dict, args: Namespace):
@@ -318,6 +356,7 @@ def update_run_config(config: Dict, args: Namespace):
         embed_line=(int(args.embed) if args.embed is not None else None),
         is_reload=False,
         prerun=args.prerun,
+        parallel=args.parallel,
         scene_names=args.scene_names,
         quiet=args.quiet or args.write_all,
         write_all=args.write_all,
@@ -330,6 +369,11 @@ def update_embed_config(config: Dict, args: Namespace):
         config.embed.autoreload = True
 
 
+def update_profiling_config(config: Dict, args: Namespace):
+    if args.profile:
+        config.profiling.enabled = True
+
+
 # Helpers for the functions above
 
 
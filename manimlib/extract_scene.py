@@ -9,6 +9,7 @@ from manimlib.module_loader import ModuleLoader
 from manimlib.config import manim_config
 from manimlib.logger import log
 from manimlib.scene.interactive_scene import InteractiveScene
+from manimlib.scene.parallel_renderer import ParallelSceneRenderer
 from manimlib.scene.scene import Scene
 
 from typing import TYPE_CHECKING
@@ -60,12 +61,10 @@ def prompt_user_for_choice(scene_classes):
         sys.exit(1)
 
 
-def compute_total_frames(scene_class, scene_config):
+def prerun_scene(scene_class, scene_config):
     """
-    When a scene is being written to file, a copy of the scene is run with
-    skip_animations set to true so as to count how many frames it will require.
-    This allows for a total progress bar on rendering, and also allows runtime
-    errors to be exposed preemptively for long running scenes.
+    Run a copy of the scene with skip_animations set to true, without
+    writing anything to file, and return it for inspection.
     """
     pre_config = copy.deepcopy(scene_config)
     pre_config["file_writer_config"]["write_to_movie"] = False
@@ -74,12 +73,25 @@ def compute_total_frames(scene_class, scene_config):
     pre_config["skip_animations"] = True
     pre_scene = scene_class(**pre_config)
     pre_scene.run()
+    return pre_scene
+
+
+def compute_total_frames(scene_class, scene_config):
+    """
+    When a scene is being written to file, a copy of the scene is run with
+    skip_animations set to true so as to count how many frames it will require.
+    This allows for a total progress bar on rendering, and also allows runtime
+    errors to be exposed preemptively for long running scenes.
+    """
+    pre_scene = prerun_scene(scene_class, scene_config)
     total_time = pre_scene.time - pre_scene.skip_time
     return int(total_time * manim_config.camera.fps)
 
 
 def scene_from_class(scene_class, scene_config: Dict, run_config: Dict):
     fw_config = manim_config.file_writer
+    if fw_config.write_to_movie and run_config.parallel > 1:
+        return ParallelSceneRenderer(scene_class, scene_config, run_config, run_config.parallel)
     if fw_config.write_to_movie and run_config.prerun:
         scene_config.file_writer_config.total_frames = compute_total_frames(scene_class, scene_config)
     return scene_class(**scene_config)
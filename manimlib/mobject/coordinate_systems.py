@@ -4,7 +4,6 @@ from abc import ABC, abstractmethod
 import numbers
 
 import numpy as np
-import itertools as it
 
 from manimlib.constants import BLACK, BLUE, BLUE_D, BLUE_E, GREEN, GREY_A, RED, DEFAULT_MOBJECT_COLOR
 from manimlib.constants import DEG, PI
@@ -22,6 +21,7 @@ from manimlib.mobject.types.dot_cloud import DotCloud
 from manimlib.mobject.types.surface import ParametricSurface
 from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.mobject.types.vectorized_mobject import VMobject
+from manimlib.utils.bezier import approx_smooth_quadratic_bezier_handle_operator
 from manimlib.utils.bezier import inverse_interpolate
 from manimlib.utils.dict_ops import merge_dicts_recursively
 from manimlib.utils.simple_functions import binary_search
@@ -196,7 +196,7 @@ class CoordinateSystem(ABC):
         t_range[:len(x_range)] = x_range
         # For axes, the third coordinate of x_range indicates
         # tick frequency.  But for functions, it indicates a
-        # sample frequency
+        # sample frequency, which adaptive sampling only refines
         t_range[2] /= self.num_sampled_graph_points_per_tick
 
         def parametric_function(t: float) -> Vect3:
@@ -265,22 +265,46 @@ class CoordinateSystem(ABC):
         graph: VMobject,
         func: Callable[[VectN], VectN],
         jagged: bool = False,
-        get_discontinuities: Optional[Callable[[], Vect3]] = None
+        get_discontinuities: Optional[Callable[[], Vect3]] = None,
+        fixed_grid: bool = False,
     ) -> VMobject:
         """@brief 将生成的曲线绑定到动态函数。
         @details 可用于需要随时间或参数变化的函数图像，会在每帧重新计算采样点并保持曲线平滑。
+        若 fixed_grid 为 True，则只在曲线当前的锚点处采样，点数保持不变，
+        控制点由预先计算的线性算子一次求得，并直接写入已有的点缓冲区。
         """
-        x_values = np.array([self.x_axis.p2n(p) for p in graph.get_points()])
+        x_values = self.x_axis.p2n(graph.get_points())
+        if fixed_grid:
+            x_values = x_values[0::2]
 
         def get_graph_points():
             xs = x_values
             if get_discontinuities:
-                ds = get_discontinuities()
+                ds = np.array(get_discontinuities(), dtype=float)
                 ep = 1e-6
-                added_xs = it.chain(*((d - ep, d + ep) for d in ds))
-                xs[:] = sorted([*x_values, *added_xs])[:len(x_values)]
+                xs[:] = np.sort(np.hstack([x_values, ds - ep, ds + ep]))[:len(x_values)]
             return self.c2p(xs, func(xs))
 
+        if fixed_grid:
+            if jagged:
+                handle_operator = None
+            else:
+                handle_operator = approx_smooth_quadratic_bezier_handle_operator(len(x_values))
+            new_points = np.zeros((2 * len(x_values) - 1, 3))
+
+            def update_graph(g):
+                anchors = get_graph_points()
+                new_points[0::2] = anchors
+                if handle_operator is None:
+                    new_points[1::2] = 0.5 * (anchors[:-1] + anchors[1:])
+                else:
+                    new_points[1::2] = handle_operator @ anchors
+                # Same number of points, so this copies into the existing data
+                g.set_points(new_points)
+
+            graph.add_updater(update_graph)
+            return graph
+
         graph.add_updater(
             lambda g: g.set_points_as_corners(get_graph_points())
         )
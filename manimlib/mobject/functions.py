@@ -3,15 +3,18 @@ from __future__ import annotations
 from isosurfaces import plot_isoline
 import numpy as np
 
+from manimlib.constants import FRAME_WIDTH
 from manimlib.constants import FRAME_X_RADIUS, FRAME_Y_RADIUS
+from manimlib.constants import DEG
 from manimlib.constants import YELLOW
 from manimlib.mobject.types.vectorized_mobject import VMobject
+from manimlib.utils.space_ops import simplify_poly_line
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import Callable, Sequence, Tuple
-    from manimlib.typing import ManimColor, Vect3
+    from manimlib.typing import ManimColor, Vect3, Vect3Array
 
 
 class ParametricCurve(VMobject):
@@ -23,9 +26,25 @@ class ParametricCurve(VMobject):
         t_func: Callable[[float], Sequence[float] | Vect3],
         t_range: Tuple[float, float, float] = (0, 1, 0.1),
         epsilon: float = 1e-8,
-        # TODO, automatically figure out discontinuities
+        # With adaptive sampling, these are also found automatically
         discontinuities: Sequence[float] = [],
         use_smoothing: bool = True,
+        # If True, t_func is first tried on the whole array of sample
+        # times at once, falling back to one call per sample if that
+        # fails or disagrees with calls on single values
+        use_vectorized_sampling: bool = False,
+        # If True, the step of t_range only sets the initial spacing of
+        # samples. Intervals are bisected wherever the curve bends away from
+        # the chord between samples by more than the tolerance, or turns by
+        # more than sampling_max_angle, up to max_sampled_points over the
+        # whole curve, and samples are then dropped wherever the curve stays
+        # within the tolerance without them. The tolerance is sampling_tolerance
+        # times the extent of the curve, itself at most the frame width.
+        # Features narrower than the initial spacing can be missed.
+        use_adaptive_sampling: bool = False,
+        sampling_tolerance: float = 1e-3,
+        sampling_max_angle: float = 10 * DEG,
+        max_sampled_points: int = 1000,
         **kwargs
     ):
         self.t_func = t_func
@@ -33,11 +52,148 @@ class ParametricCurve(VMobject):
         self.epsilon = epsilon
         self.discontinuities = discontinuities
         self.use_smoothing = use_smoothing
+        self.use_vectorized_sampling = use_vectorized_sampling
+        self.use_adaptive_sampling = use_adaptive_sampling
+        self.sampling_tolerance = sampling_tolerance
+        self.sampling_max_angle = sampling_max_angle
+        self.max_sampled_points = max_sampled_points
         super().__init__(**kwargs)
 
     def get_point_from_function(self, t: float) -> Vect3:
         return np.array(self.t_func(t))
 
+    def get_points_from_function(self, t_values: np.ndarray) -> Vect3Array:
+        if self.use_vectorized_sampling:
+            points = self.get_points_from_vectorized_function(t_values)
+            if points is not None:
+                return points
+        return np.array([self.t_func(t) for t in t_values])
+
+    def get_points_from_vectorized_function(self, t_values: np.ndarray) -> Vect3Array | None:
+        # Accepts either an array of points, as returned by c2p on arrays,
+        # or a sequence of coordinates, each either an array or a constant
+        shape = (len(t_values), self.dim)
+        try:
+            output = self.t_func(t_values)
+            if isinstance(output, np.ndarray) and output.shape == shape and len(t_values) != self.dim:
+                points = output
+            else:
+                points = np.transpose(np.broadcast_arrays(*output))
+            if points.shape != shape:
+                return None
+            # Catch functions which accept arrays, but treat them
+            # differently from the single values they were written for
+            for index in [0, -1]:
+                if not np.allclose(points[index], self.t_func(t_values[index]), equal_nan=True):
+                    return None
+        except Exception:
+            return None
+        return points.astype(float)
+
+    def get_sampling_tolerance(self, points: Vect3Array) -> float:
+        # Relative to the size of the curve, but with that size capped
+        # at the frame width, so that poles don't inflate it
+        finite_points = points[np.isfinite(points).all(1)]
+        if len(finite_points) < 2:
+            return self.sampling_tolerance
+        extent = min(np.ptp(finite_points, axis=0).max(), FRAME_WIDTH)
+        return self.sampling_tolerance * (extent or 1.0)
+
+    def needs_refinement(
+        self,
+        points0: Vect3Array,
+        mid_points: Vect3Array,
+        points1: Vect3Array,
+        tol: float,
+    ) -> np.ndarray:
+        chord_lengths = np.linalg.norm(points1 - points0, axis=1)
+        deviations = np.linalg.norm(mid_points - (points0 + points1) / 2, axis=1)
+        vects1 = mid_points - points0
+        vects2 = points1 - mid_points
+        angles = np.arctan2(
+            np.linalg.norm(np.cross(vects1, vects2), axis=1),
+            (vects1 * vects2).sum(1),
+        )
+        finite = np.isfinite(np.hstack([points0, mid_points, points1])).all(1)
+        # Turns along chords shorter than the tolerance don't matter
+        return ~finite | (deviations > tol) | ((chord_lengths > tol) & (angles > self.sampling_max_angle))
+
+    def get_adaptive_samples(
+        self,
+        t1: float,
+        t2: float,
+        step: float,
+        max_points: int | None = None,
+    ) -> list[Vect3Array]:
+        """@brief 在 [t1, t2] 上自适应地采样曲线。
+        @details 从步长为 step 的初始采样开始，反复二分弦偏差或转角超出容差的区间，直到满足容差或达到点数上限
+        max_points（默认为 max_sampled_points），初始采样点始终保留。二分后弦长未随之缩短的区间疑似跨越跳跃或极点，
+        它们优先使用预留的四分之一点数继续二分。
+        若区间缩小到 epsilon 量级后弦长仍超过容差，或函数值非有限，则视为不连续点并在此处断开路径。
+        最后在各连续段内删去去掉后偏差仍不超过容差的采样点，返回各段的采样点列表。
+        """
+        if max_points is None:
+            max_points = self.max_sampled_points
+        # Refining where the curve bends may use all but a quarter of the
+        # budget, the rest being left for narrowing down jumps and poles
+        bend_budget = max_points - max_points // 4
+        ts = np.array([*np.arange(t1, t2, step), t2])
+        points = self.get_points_from_function(ts)
+        tol = self.get_sampling_tolerance(points)
+        min_width = 10 * self.epsilon
+        unresolved = np.ones(len(ts) - 1, dtype=bool)
+        # Intervals whose chord didn't shrink when last bisected
+        suspected_jumps = ~np.isfinite(points[:-1] - points[1:]).all(1)
+
+        while True:
+            open_intervals = unresolved & (np.diff(ts) > min_width)
+            bend_indices = np.flatnonzero(open_intervals & ~suspected_jumps)
+            jump_indices = np.flatnonzero(open_intervals & suspected_jumps)
+            bend_room = max(bend_budget - len(ts), 0)
+            if len(bend_indices) > bend_room:
+                # Spend what's left of the budget on the longest chords
+                chord_lengths = np.linalg.norm(points[bend_indices + 1] - points[bend_indices], axis=1)
+                chord_lengths[~np.isfinite(chord_lengths)] = np.inf
+                bend_indices = bend_indices[np.argsort(-chord_lengths)[:bend_room]]
+            jump_room = max(max_points - len(ts) - len(bend_indices), 0)
+            indices = np.sort(np.hstack([bend_indices, jump_indices[:jump_room]]))
+            if len(indices) == 0:
+                break
+
+            mid_ts = (ts[indices] + ts[indices + 1]) / 2
+            mid_points = self.get_points_from_function(mid_ts)
+            points0 = points[indices]
+            points1 = points[indices + 1]
+            split = self.needs_refinement(points0, mid_points, points1, tol)
+
+            # The halves of a smooth stretch have about half its chord,
+            # while at a jump or pole one half keeps all of it, or more
+            with np.errstate(invalid="ignore"):
+                max_chords = 0.75 * np.linalg.norm(points1 - points0, axis=1)
+                jumps1 = ~(np.linalg.norm(mid_points - points0, axis=1) < max_chords)
+                jumps2 = ~(np.linalg.norm(points1 - mid_points, axis=1) < max_chords)
+
+            unresolved[indices] = False
+            unresolved[indices[split]] = True
+            suspected_jumps[indices[split]] = jumps1[split]
+            positions = indices[split] + 1
+            ts = np.insert(ts, positions, mid_ts[split])
+            points = np.insert(points, positions, mid_points[split], axis=0)
+            unresolved = np.insert(unresolved, positions, True)
+            suspected_jumps = np.insert(suspected_jumps, positions, jumps2[split])
+
+        # Break the path wherever the function isn't finite, or where
+        # samples remain far apart even at the smallest spacing, with
+        # a chord which stopped shrinking under bisection
+        finite = np.isfinite(points).all(1)
+        jumps = suspected_jumps & (np.diff(ts) <= min_width) & ~(np.linalg.norm(np.diff(points, axis=0), axis=1) <= tol)
+        breaks = np.zeros(len(ts), dtype=bool)
+        breaks[1:] = jumps | ~finite[:-1] | ~finite[1:]
+        pieces = np.split(points, np.flatnonzero(breaks))
+        pieces = [piece[np.isfinite(piece).all(1)] for piece in pieces]
+        # Lone samples between two breaks, e.g. right at a pole, are dropped
+        return [piece[simplify_poly_line(piece, tol)] for piece in pieces if len(piece) > 1]
+
     def init_points(self):
         """@brief 初始化曲线采样点。
         @details 按照给定参数范围与步长生成路径，自动在不连续点附近分段，并在需要时进行平滑。
@@ -48,11 +204,19 @@ class ParametricCurve(VMobject):
         jumps = jumps[(jumps > t_min) & (jumps < t_max)]
         boundary_times = [t_min, t_max, *(jumps - self.epsilon), *(jumps + self.epsilon)]
         boundary_times.sort()
-        for t1, t2 in zip(boundary_times[0::2], boundary_times[1::2]):
-            t_range = [*np.arange(t1, t2, step), t2]
-            points = np.array([self.t_func(t) for t in t_range])
-            self.start_new_path(points[0])
-            self.add_points_as_corners(points[1:])
+        intervals = list(zip(boundary_times[0::2], boundary_times[1::2]))
+        total_length = sum(t2 - t1 for t1, t2 in intervals) or 1.0
+        for t1, t2 in intervals:
+            if self.use_adaptive_sampling:
+                # Share the budget of points between intervals by length
+                max_points = int(self.max_sampled_points * (t2 - t1) / total_length)
+                pieces = self.get_adaptive_samples(t1, t2, step, max_points)
+            else:
+                t_range = np.array([*np.arange(t1, t2, step), t2])
+                pieces = [self.get_points_from_function(t_range)]
+            for points in pieces:
+                self.start_new_path(points[0])
+                self.add_points_as_corners(points[1:])
         if self.use_smoothing:
             self.make_smooth(approx=True)
         if not self.has_points():
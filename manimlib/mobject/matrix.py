@@ -70,8 +70,8 @@ class Matrix(VMobject):
             ellipses_col,
         )
 
-    def copy(self, deep: bool = False):
-        result = super().copy(deep)
+    def copy(self, deep: bool = False, share_data: bool = False):
+        result = super().copy(deep, share_data)
         self_family = self.get_family()
         copy_family = result.get_family()
         for attr in ["elements", "ellipses"]:
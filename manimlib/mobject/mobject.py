@@ -28,6 +28,7 @@ from manimlib.utils.color import color_gradient
 from manimlib.utils.color import color_to_rgb
 from manimlib.utils.color import get_colormap_list
 from manimlib.utils.color import rgb_to_hex
+from manimlib.utils.data_arena import DataArena
 from manimlib.utils.iterables import arrays_match
 from manimlib.utils.iterables import array_is_constant
 from manimlib.utils.iterables import batch_by_property
@@ -39,6 +40,7 @@ from manimlib.utils.iterables import resize_with_interpolation
 from manimlib.utils.bezier import integer_interpolate
 from manimlib.utils.bezier import interpolate
 from manimlib.utils.paths import straight_path
+from manimlib.utils.profiling import profiler
 from manimlib.utils.shaders import get_colormap_code
 from manimlib.utils.space_ops import angle_of_vector
 from manimlib.utils.space_ops import get_norm
@@ -61,6 +63,10 @@ if TYPE_CHECKING:
     Updater = Union[TimeBasedUpdater, NonTimeUpdater]
 
 
+# Source of Mobject._data_version values, see get_family_version
+_data_versions = it.count()
+
+
 class Mobject(object):
     """
     Mathematical Object
@@ -109,6 +115,15 @@ class Mobject(object):
         self._is_animating: bool = False
         self._needs_new_bounding_box: bool = True
         self._data_has_changed: bool = True
+        # Whether this mobject was itself noted as changed, as opposed to only
+        # some descendant, in which case its whole family may have changed.
+        # See get_changed_family_members
+        self._family_data_changed: bool = True
+        # Bumped whenever data or uniforms are noted as changed
+        self._data_version: int = next(_data_versions)
+        # See use_packed_family_data
+        self.data_arena: DataArena | None = None
+        self.packed_data_arenas: dict[np.dtype, DataArena] | None = None
         self.shader_code_replacements: dict[str, str] = dict()
 
         self.init_data()
@@ -157,6 +172,7 @@ class Mobject(object):
             if isinstance(value, np.ndarray):
                 value = value.copy()
             self.uniforms[key] = value
+        self.note_changed_uniforms()
         return self
 
     @property
@@ -204,15 +220,33 @@ class Mobject(object):
 
     def note_changed_data(self, recurse_up: bool = True) -> Self:
         self._data_has_changed = True
+        self._family_data_changed = True
+        self._data_version = next(_data_versions)
+        if self.data_arena is not None:
+            # Shader vertex indices may have changed along with the data
+            self.data_arena.clear_index_cache()
         if recurse_up:
             for mob in self.parents:
-                mob.note_changed_data()
+                mob.note_changed_descendant_data()
+        return self
+
+    def note_changed_descendant_data(self) -> Self:
+        self._data_has_changed = True
+        for mob in self.parents:
+            mob.note_changed_descendant_data()
         return self
 
+    def note_changed_uniforms(self) -> Self:
+        # Uniforms don't live in vertex buffers, so this only marks
+        # the mobject as needing to be drawn again
+        self._data_version = next(_data_versions)
+        return self.note_changed_descendant_data()
+
     @staticmethod
     def affects_data(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(self, *args, **kwargs):
+            self.own_family_data()
             result = func(self, *args, **kwargs)
             self.note_changed_data()
             return result
@@ -222,6 +256,7 @@ class Mobject(object):
     def affects_family_data(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(self, *args, **kwargs):
+            self.own_family_data()
             result = func(self, *args, **kwargs)
             for mob in self.family_members_with_points():
                 mob.note_changed_data()
@@ -410,7 +445,6 @@ class Mobject(object):
     def split(self) -> list[Self]:
         return self.submobjects
 
-    @affects_data
     def note_changed_family(self, only_changed_order=False) -> Self:
         self.family = None
         if not only_changed_order:
@@ -418,6 +452,7 @@ class Mobject(object):
             self.refresh_bounding_box()
         for parent in self.parents:
             parent.note_changed_family()
+        self.note_changed_data()
         return self
 
     def get_family(self, recurse: bool = True) -> list[Mobject]:
@@ -658,7 +693,19 @@ class Mobject(object):
     def deepcopy(self) -> Self:
         return copy.deepcopy(self)
 
-    def copy(self, deep: bool = False) -> Self:
+    def copy(self, deep: bool = False, share_data: bool = False) -> Self:
+        """
+        With share_data, each family member of the copy uses the same data
+        array as the original, marked read-only, until one of the two is about
+        to change it and takes its own copy with own_data. Copies which are
+        mostly only read, like undo states and the starting mobjects of
+        animations, then cost little until something actually changes.
+
+        Methods changing data in place should call own_data first, as those
+        decorated with affects_data or affects_family_data do. Writing into
+        shared data by other means raises an error, rather than silently
+        changing both mobjects.
+        """
         if deep:
             return self.deepcopy()
 
@@ -679,7 +726,10 @@ class Mobject(object):
         # Instead of adding using result.add, which does some checks for updating
         # updater statues and bounding box, just directly modify the family-related
         # lists
-        result.submobjects = [sm.copy() for sm in self.submobjects]
+        if share_data:
+            result.submobjects = [sm.copy(share_data=True) for sm in self.submobjects]
+        else:
+            result.submobjects = [sm.copy() for sm in self.submobjects]
         for sm in result.submobjects:
             sm.parents = [result]
         result.family = [result, *it.chain(*(sm.get_family() for sm in result.submobjects))]
@@ -688,7 +738,12 @@ class Mobject(object):
         # won't have changed, just directly match.
         result.updaters = list(self.updaters)
         result._data_has_changed = True
+        result._family_data_changed = True
+        result._data_version = next(_data_versions)
         result.shader_wrapper = None
+        result.data_arena = None
+        if self.packed_data_arenas is not None:
+            result.packed_data_arenas = dict()
 
         family = self.get_family()
         for attr, value in self.__dict__.items():
@@ -696,9 +751,28 @@ class Mobject(object):
                 if value in family:
                     setattr(result, attr, result.family[family.index(value)])
             elif isinstance(value, np.ndarray):
-                setattr(result, attr, value.copy())
+                # Views, e.g. into packed family data, may be written
+                # through their base, so they're never shared
+                if share_data and attr == "data" and value.flags.owndata:
+                    value.flags.writeable = False
+                else:
+                    setattr(result, attr, value.copy())
         return result
 
+    def own_data(self) -> Self:
+        """
+        Ensure this mobject's data is not shared with a copy made
+        with share_data=True, so that it can be changed in place
+        """
+        if not self.data.flags.writeable:
+            self.data = self.data.copy()
+        return self
+
+    def own_family_data(self) -> Self:
+        for mob in self.get_family():
+            mob.own_data()
+        return self
+
     def generate_target(self, use_deepcopy: bool = False) -> Self:
         self.target = self.copy(deep=use_deepcopy)
         self.target.saved_state = self.saved_state
@@ -740,6 +814,18 @@ class Mobject(object):
             self.match_updaters(mobject)
         return self
 
+    def get_family_version(self) -> tuple[int, ...]:
+        """
+        Changes whenever the data or uniforms of any family member are
+        noted as changed, or the family itself changes. Comparing these
+        is a cheap stand-in for looks_identical, so long as all changes
+        go through note_changed_data or note_changed_uniforms.
+
+        Ancestors are left out, since they include groups such as those
+        the scene rebuilds for rendering on every change to its contents.
+        """
+        return tuple(mob._data_version for mob in self.get_family())
+
     def looks_identical(self, mobject: Mobject) -> bool:
         fam1 = self.family_members_with_points()
         fam2 = mobject.family_members_with_points()
@@ -1813,6 +1899,7 @@ class Mobject(object):
     ) -> Self:
         keys = [k for k in self.data.dtype.names if k not in self.locked_data_keys]
         if keys:
+            self.own_data()
             self.note_changed_data()
         for key in keys:
             md1 = mobject1.data[key]
@@ -1915,6 +2002,8 @@ class Mobject(object):
     def set_uniform(self, recurse: bool = True, **new_uniforms) -> Self:
         for mob in self.get_family(recurse):
             mob.uniforms.update(new_uniforms)
+            mob._data_version = next(_data_versions)
+        self.note_changed_uniforms()
         return self
 
     @affects_shader_info_id
@@ -1953,10 +2042,12 @@ class Mobject(object):
                 submob.uniforms["clip_plane"][:3] = vect
             if threshold is not None:
                 submob.uniforms["clip_plane"][3] = threshold
+        self.note_changed_uniforms()
         return self
 
     def deactivate_clip_plane(self) -> Self:
         self.uniforms["clip_plane"][:] = 0
+        self.note_changed_uniforms()
         return self
 
     # Shader code manipulation
@@ -2026,6 +2117,7 @@ class Mobject(object):
             if submob.shader_wrapper is not None:
                 submob.shader_wrapper.depth_test = submob.depth_test
                 submob.shader_wrapper.refresh_id()
+        self._data_version = next(_data_versions)
         for mob in (self, *self.get_ancestors()):
             mob._data_has_changed = True
         return self
@@ -2035,22 +2127,133 @@ class Mobject(object):
             self.init_shader_wrapper(ctx)
         return self.shader_wrapper
 
+    def use_packed_family_data(self, use: bool = True) -> Self:
+        """
+        When rendering, keep the data of all family members in shared
+        buffers, one per dtype, with each member's data a view into one,
+        so that a batch of members can be sent to its shader as a single
+        slice rather than concatenated each frame. This pays off for
+        large, mostly static groups, like the background of a NumberPlane
+        or dense Tex.
+
+        This holds wherever the mobject is rendered from, including
+        within the groups a Scene assembles for rendering.
+        """
+        if use and self.packed_data_arenas is None:
+            self.packed_data_arenas = dict()
+        elif not use and self.packed_data_arenas is not None:
+            for arena in self.packed_data_arenas.values():
+                arena.release()
+            self.packed_data_arenas = None
+        self.note_changed_data()
+        return self
+
+    def get_packed_family_roots(self) -> list[Mobject]:
+        """
+        Members of the family, including self, which use packed family
+        data and don't lie within another which does
+        """
+        return [
+            mob for mob in self.get_family()
+            if mob.packed_data_arenas is not None
+            and not any(
+                ancestor.packed_data_arenas is not None
+                for ancestor in mob.get_ancestors()
+            )
+        ]
+
+    def refresh_data_arenas(self) -> None:
+        members_by_dtype = dict()
+        for mob in self.family_members_with_points():
+            members_by_dtype.setdefault(mob.data.dtype, []).append(mob)
+        for dtype, members in members_by_dtype.items():
+            if dtype not in self.packed_data_arenas:
+                self.packed_data_arenas[dtype] = DataArena(dtype)
+            arena = self.packed_data_arenas[dtype]
+            if not arena.holds(members):
+                arena.pack(members)
+
+    def get_changed_family_members(self) -> set[int]:
+        """
+        Return the ids of family members whose data may have changed
+        since this was last called, and reset the flags tracking that.
+        Subtrees in which nothing was noted as changed are skipped.
+        """
+        changed = set()
+        to_process = [(self, False)]
+        while to_process:
+            mob, parent_changed = to_process.pop()
+            mob_changed = parent_changed or mob._family_data_changed
+            if mob_changed:
+                changed.add(id(mob))
+            if mob_changed or mob._data_has_changed:
+                to_process.extend((sm, mob_changed) for sm in mob.submobjects)
+            mob._data_has_changed = False
+            mob._family_data_changed = False
+        return changed
+
     def get_shader_wrapper_list(self, ctx: Context) -> list[ShaderWrapper]:
         """@brief 构造当前 Mobject 及其子代共享的 ShaderWrapper 列表。
         @details 按着色器 ID 批量聚合子 Mobject，将几何数据上传到 GPU，避免重复初始化 shader。
         """
         family = self.family_members_with_points()
-        batches = batch_by_property(family, lambda sm: sm.get_shader_wrapper(ctx).get_id())
+        changed_ids = self.get_changed_family_members()
+        for root in self.get_packed_family_roots():
+            root.refresh_data_arenas()
+        # Members packed into different arenas, or none, are batched
+        # separately, so that packed batches can be read out in one go
+        batches = batch_by_property(
+            family,
+            lambda sm: (sm.get_shader_wrapper(ctx).get_id(), id(sm.data_arena))
+        )
 
         result = []
-        for submobs, sid in batches:
+        for submobs, key in batches:
             shader_wrapper = submobs[0].shader_wrapper
-            data_list = [sm.get_shader_data() for sm in submobs]
-            shader_wrapper.read_in(data_list)
+            packed_data = None
+            if submobs[0].data_arena is not None:
+                packed_data = submobs[0].data_arena.get_shader_data(submobs)
+            if packed_data is not None:
+                shader_wrapper.read_in([packed_data])
+            else:
+                self.read_in_shader_data(shader_wrapper, submobs, changed_ids)
             result.append(shader_wrapper)
         return result
 
+    def read_in_shader_data(
+        self,
+        shader_wrapper: ShaderWrapper,
+        submobs: list[Mobject],
+        changed_ids: set[int],
+    ) -> None:
+        """
+        If the shader wrapper already holds the data for this same batch
+        of submobjects, only replace that of those which changed, so that
+        e.g. one animated number in a large static group doesn't require
+        the whole group to be sent to the GPU again.
+        """
+        member_keys = list(map(id, submobs))
+        if shader_wrapper.holds_members(member_keys):
+            changed_indices = [
+                index for index, sm in enumerate(submobs)
+                if id(sm) in changed_ids
+            ]
+            # When most of the batch changed, one full write is cheaper
+            if 2 * len(changed_indices) <= len(submobs):
+                shader_wrapper.write_member_data({
+                    index: submobs[index].get_shader_data()
+                    for index in changed_indices
+                })
+                return
+        shader_wrapper.read_in([sm.get_shader_data() for sm in submobs], member_keys)
+
+    def refresh_shader_data(self) -> None:
+        # May be implemented by subclasses which derive
+        # some of their data just before rendering
+        pass
+
     def get_shader_data(self) -> np.ndarray:
+        self.refresh_shader_data()
         indices = self.get_shader_vert_indices()
         if indices is not None:
             return self.data[indices]
@@ -2068,7 +2271,9 @@ class Mobject(object):
         @details 当数据发生变化时，重建 ShaderWrapper 列表并上传顶点缓冲，然后更新 uniform、执行绘制命令。
         """
         if self._data_has_changed:
-            self.shader_wrappers = self.get_shader_wrapper_list(ctx)
+            with profiler.section("get_shader_wrapper_list"):
+                self.shader_wrappers = self.get_shader_wrapper_list(ctx)
+            profiler.count("shader_wrappers_rebuilt", len(self.shader_wrappers))
             self._data_has_changed = False
         for shader_wrapper in self.shader_wrappers:
             shader_wrapper.update_program_uniforms(camera_uniforms)
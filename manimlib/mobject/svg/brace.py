@@ -163,10 +163,10 @@ class BraceLabel(VMobject):
         self.change_label(*text)
         return self
 
-    def copy(self):
+    def copy(self, deep: bool = False, share_data: bool = False):
         copy_mobject = copy.copy(self)
-        copy_mobject.brace = self.brace.copy()
-        copy_mobject.label = self.label.copy()
+        copy_mobject.brace = self.brace.copy(share_data=share_data)
+        copy_mobject.label = self.label.copy(share_data=share_data)
         copy_mobject.set_submobjects([copy_mobject.brace, copy_mobject.label])
 
         return copy_mobject
@@ -110,7 +110,18 @@ class StringMobject(SVGMobject, ABC):
                 )
             )
 
+    def prefetch_svg_string_by_content(self, content: str) -> None:
+        # May be implemented by subclasses to start generating the svg for
+        # content in the background, ahead of get_svg_string_by_content
+        pass
+
     def mobjects_from_svg_string(self, svg_string: str) -> list[VMobject]:
+        if not self.use_labelled_svg:
+            # Let the labelled svg, which is needed below, be generated
+            # while the unlabelled one is parsed
+            labelled_content = self.get_content(is_labelled=True)
+            self.prefetch_svg_string_by_content(labelled_content)
+
         submobs = super().mobjects_from_svg_string(svg_string)
 
         if self.use_labelled_svg:
@@ -121,7 +132,6 @@ class StringMobject(SVGMobject, ABC):
         # Otherwise, submobs are not colored, so generate a new list
         # of submobject which are and use those for labels
         unlabelled_submobs = submobs
-        labelled_content = self.get_content(is_labelled=True)
         labelled_file = self.get_svg_string_by_content(labelled_content)
         labelled_submobs = super().mobjects_from_svg_string(labelled_file)
         self.labelled_submobs = labelled_submobs
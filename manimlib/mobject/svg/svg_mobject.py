@@ -18,8 +18,11 @@ from manimlib.mobject.geometry import Rectangle
 from manimlib.mobject.geometry import RoundedRectangle
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.bezier import quadratic_bezier_points_for_arc
+from manimlib.utils.cache import get_cached_value
+from manimlib.utils.cache import set_cached_value
 from manimlib.utils.images import get_full_vector_image_path
 from manimlib.utils.iterables import hash_obj
+from manimlib.utils.simple_functions import hash_string
 from manimlib.utils.space_ops import rotation_about_z
 
 from typing import TYPE_CHECKING
@@ -35,6 +38,64 @@ def _convert_point_to_3d(x: float, y: float) -> np.ndarray:
     return np.array([x, y, 0.0])
 
 
+def svg_mobjects_to_bytes(mobjects: list[VMobject]) -> bytes | None:
+    """
+    Packs the data, uniforms and labels of parsed svg submobjects into
+    a compressed npz archive, or returns None if they can't be stored
+    as flat arrays (e.g. submobjects with differing uniforms).
+    """
+    if len(mobjects) == 0 or any(mob.submobjects for mob in mobjects):
+        return None
+    uniform_keys = sorted(mobjects[0].uniforms)
+    if any(sorted(mob.uniforms) != uniform_keys for mob in mobjects):
+        return None
+    try:
+        uniforms = {
+            f"uniform_{key}": np.array([mob.uniforms[key] for mob in mobjects], dtype=float)
+            for key in uniform_keys
+        }
+        data = np.concatenate([mob.data for mob in mobjects])
+    except ValueError:
+        return None
+
+    has_labels = all(hasattr(mob, "label") for mob in mobjects)
+    stream = io.BytesIO()
+    np.savez_compressed(
+        stream,
+        data=data,
+        lengths=np.array([len(mob.data) for mob in mobjects]),
+        labels=np.array([mob.label if has_labels else -1 for mob in mobjects]),
+        **uniforms,
+    )
+    return stream.getvalue()
+
+
+def svg_mobjects_from_bytes(value: bytes, vmobject_config: dict) -> list[VMobject]:
+    with np.load(io.BytesIO(value)) as archive:
+        data = archive["data"]
+        lengths = archive["lengths"]
+        labels = archive["labels"]
+        uniforms = {
+            name[len("uniform_"):]: archive[name]
+            for name in archive.files
+            if name.startswith("uniform_")
+        }
+
+    result = []
+    ends = np.cumsum(lengths)
+    for index, (start, end) in enumerate(zip(ends - lengths, ends)):
+        mob = VMobject(**vmobject_config)
+        mob.set_data(data[start:end])
+        mob.set_uniforms({
+            key: value[index] if value[index].ndim > 0 else float(value[index])
+            for key, value in uniforms.items()
+        })
+        if labels[index] >= 0:
+            mob.label = int(labels[index])
+        result.append(mob)
+    return result
+
+
 class SVGMobject(VMobject):
     file_name: str = ""
     height: float | None = 2.0
@@ -110,7 +171,7 @@ class SVGMobject(VMobject):
         if hash_val in SVG_HASH_TO_MOB_MAP:
             submobs = [sm.copy() for sm in SVG_HASH_TO_MOB_MAP[hash_val]]
         else:
-            submobs = self.mobjects_from_svg_string(self.svg_string)
+            submobs = self.load_svg_mobjects()
             SVG_HASH_TO_MOB_MAP[hash_val] = [sm.copy() for sm in submobs]
 
         self.add(*submobs)
@@ -127,6 +188,26 @@ class SVGMobject(VMobject):
             self.svg_string
         )
 
+    def get_disk_cache_key(self) -> str:
+        # Unlike hash_obj, this must be stable across processes
+        return "svg_mobjects_" + hash_string(repr(self.hash_seed))
+
+    def load_svg_mobjects(self) -> list[VMobject]:
+        """
+        Returns the submobjects for this svg, using the arrays stored in the
+        on-disk cache when available, so that later runs (and other processes)
+        need not parse the svg again.
+        """
+        key = self.get_disk_cache_key()
+        value = get_cached_value(key)
+        if value is not None:
+            return svg_mobjects_from_bytes(value, self.path_string_config)
+        submobs = self.mobjects_from_svg_string(self.svg_string)
+        value = svg_mobjects_to_bytes(submobs)
+        if value is not None:
+            set_cached_value(key, value)
+        return submobs
+
     def mobjects_from_svg_string(self, svg_string: str) -> list[VMobject]:
         element_tree = ET.ElementTree(ET.fromstring(svg_string))
         new_tree = self.modify_xml_tree(element_tree)
@@ -8,13 +8,21 @@ from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.color import color_to_hex
 from manimlib.utils.color import hex_to_int
+from manimlib.utils.tex_file_writing import DeferredLatexCompilation
+from manimlib.utils.tex_file_writing import collect_latex_requests
+from manimlib.utils.tex_file_writing import compile_latex_requests
+from manimlib.utils.tex_file_writing import is_collecting_latex_requests
 from manimlib.utils.tex_file_writing import latex_to_svg
+from manimlib.utils.tex_file_writing import record_latex_request
+from manimlib.utils.tex_file_writing import submit_latex_requests
+from manimlib.utils.tex_file_writing import submit_latex_to_svg
 from manimlib.utils.tex import num_tex_symbols
 from manimlib.logger import log
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from typing import Iterable
     from manimlib.typing import ManimColor, Span, Selector, Self
 
 
@@ -67,9 +75,22 @@ class Tex(StringMobject):
 
         self.font_size = font_size  # Important for this to go after the scale call
 
+    def get_svg_string(self, is_labelled: bool = False) -> str:
+        if is_collecting_latex_requests() and not (is_labelled or self.use_labelled_svg):
+            # Construction stops at the first request, see prefetch_tex,
+            # but would go on to need the labelled svg as well
+            record_latex_request(
+                self.get_content(is_labelled=True),
+                self.template, self.additional_preamble, short_tex=self.tex_string
+            )
+        return super().get_svg_string(is_labelled)
+
     def get_svg_string_by_content(self, content: str) -> str:
         return latex_to_svg(content, self.template, self.additional_preamble, short_tex=self.tex_string)
 
+    def prefetch_svg_string_by_content(self, content: str) -> None:
+        submit_latex_to_svg(content, self.template, self.additional_preamble, short_tex=self.tex_string)
+
     def _handle_scale_side_effects(self, scale_factor: float) -> Self:
         if hasattr(self, "font_size"):
             self.font_size *= scale_factor
@@ -264,3 +285,37 @@ class Tex(StringMobject):
 
 class TexText(Tex):
     tex_environment: str = ""
+
+
+def prefetch_tex(
+    tex_strings: Iterable[str | tuple[str, ...]],
+    tex_class: type[Tex] = Tex,
+    batch: bool = True,
+    **kwargs
+) -> None:
+    """
+    Compile the LaTeX behind many Tex (or TexText) mobjects ahead of time,
+    so that constructing them later only reads from the cache. Each entry of
+    tex_strings is what would be passed as the positional arguments of
+    tex_class, and kwargs apply to all.
+
+    If batch is True, this blocks while everything is compiled as pages of a
+    single document per template. Otherwise, each string is handed to a pool
+    of concurrent compilations and this returns immediately; constructing the
+    corresponding mobject later waits only for its own compilation.
+
+    Tex mobjects constructed without this compile one after another, since
+    each needs its SVG as soon as it's constructed, so this is the way to
+    have independent equations compile concurrently.
+    """
+    with collect_latex_requests() as requests:
+        for tex_string in tex_strings:
+            args = (tex_string,) if isinstance(tex_string, str) else tex_string
+            try:
+                tex_class(*args, **kwargs)
+            except DeferredLatexCompilation:
+                pass
+    if batch:
+        compile_latex_requests(requests)
+    else:
+        submit_latex_requests(requests)
@@ -114,12 +114,15 @@ class Sphere(Surface):
             self.data['d_normal_point'] = self.data['point'] * ((radius + self.normal_nudge) / radius)
 
     def uv_func(self, u: float, v: float) -> np.ndarray:
+        return self.get_points_from_uv(np.array(u), np.array(v))
+
+    def get_points_from_uv(self, u: np.ndarray, v: np.ndarray) -> np.ndarray:
         sign = -1 if self.clockwise else +1
-        return self.radius * np.array([
-            math.cos(sign * u) * math.sin(v),
-            math.sin(sign * u) * math.sin(v),
-            -math.cos(v)
-        ])
+        return self.radius * np.stack([
+            np.cos(sign * u) * np.sin(v),
+            np.sin(sign * u) * np.sin(v),
+            -np.cos(v)
+        ], axis=-1)
 
 
 class Torus(Surface):
@@ -140,8 +143,11 @@ class Torus(Surface):
         )
 
     def uv_func(self, u: float, v: float) -> np.ndarray:
-        P = np.array([math.cos(u), math.sin(u), 0])
-        return (self.r1 - self.r2 * math.cos(v)) * P - self.r2 * math.sin(v) * OUT
+        return self.get_points_from_uv(np.array(u), np.array(v))
+
+    def get_points_from_uv(self, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+        r = self.r1 - self.r2 * np.cos(v)
+        return np.stack([r * np.cos(u), r * np.sin(u), -self.r2 * np.sin(v)], axis=-1)
 
 
 class Cylinder(Surface):
@@ -172,7 +178,11 @@ class Cylinder(Surface):
         self.apply_matrix(z_to_vector(self.axis))
 
     def uv_func(self, u: float, v: float) -> np.ndarray:
-        return np.array([np.cos(u), np.sin(u), v])
+        return self.get_points_from_uv(np.array(u), np.array(v))
+
+    def get_points_from_uv(self, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+        u, v = np.broadcast_arrays(u, v)
+        return np.stack([np.cos(u), np.sin(u), v], axis=-1)
 
 
 class Cone(Cylinder):
@@ -186,7 +196,11 @@ class Cone(Cylinder):
         super().__init__(u_range=u_range, v_range=v_range, *args, **kwargs)
 
     def uv_func(self, u: float, v: float) -> np.ndarray:
-        return np.array([(1 - v) * np.cos(u), (1 - v) * np.sin(u), v])
+        return self.get_points_from_uv(np.array(u), np.array(v))
+
+    def get_points_from_uv(self, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+        u, v = np.broadcast_arrays(u, v)
+        return np.stack([(1 - v) * np.cos(u), (1 - v) * np.sin(u), v], axis=-1)
 
 
 class Line3D(Cylinder):
@@ -227,11 +241,14 @@ class Disk3D(Surface):
         self.scale(radius)
 
     def uv_func(self, u: float, v: float) -> np.ndarray:
-        return np.array([
-            u * math.cos(v),
-            u * math.sin(v),
-            0
-        ])
+        return self.get_points_from_uv(np.array(u), np.array(v))
+
+    def get_points_from_uv(self, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+        return np.stack([
+            u * np.cos(v),
+            u * np.sin(v),
+            np.zeros_like(u * v),
+        ], axis=-1)
 
 
 class Square3D(Surface):
@@ -13,6 +13,7 @@ from manimlib.utils.images import get_full_raster_image_path
 from manimlib.utils.iterables import listify
 from manimlib.utils.iterables import resize_with_interpolation
 from manimlib.utils.simple_functions import clip
+from manimlib.utils.space_ops import get_norm
 from manimlib.utils.space_ops import normalize_along_axis
 from manimlib.utils.space_ops import cross
 
@@ -22,6 +23,7 @@ if TYPE_CHECKING:
     from typing import Callable, Iterable, Sequence, Tuple
 
     from manimlib.camera.camera import Camera
+    from manimlib.camera.camera_frame import CameraFrame
     from manimlib.typing import ManimColor, Vect3, Vect3Array, Self
 
 
@@ -52,6 +54,9 @@ class Surface(Mobject):
         # Step off the surface to a new point which will
         # be used to determine the normal direction
         normal_nudge: float = 1e-3,
+        # Fewest samples along each axis which coarser
+        # levels of detail keep, see use_level_of_detail
+        min_lod_samples: int = 5,
         **kwargs
     ):
         self.u_range = u_range
@@ -60,6 +65,7 @@ class Surface(Mobject):
         self.prefered_creation_axis = prefered_creation_axis
         self.epsilon = epsilon
         self.normal_nudge = normal_nudge
+        self.min_lod_samples = min_lod_samples
 
         super().__init__(
             **kwargs,
@@ -73,25 +79,44 @@ class Surface(Mobject):
         # To be implemented in subclasses
         return (u, v, 0.0)
 
+    def get_points_from_uv(self, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+        """
+        Applies uv_func to arrays of u and v values with the same shape,
+        returning points in an array of that shape with an extra last axis.
+
+        Subclasses whose uv_func can be written with array operations
+        should override this with that form, and have uv_func call it,
+        rather than paying for a Python call per point.
+        """
+        return np.apply_along_axis(
+            lambda p: self.uv_func(*p), -1, np.stack([u, v], axis=-1)
+        )
+
+    def has_vectorized_uv_func(self) -> bool:
+        # A subclass which only overrides uv_func, below a class which
+        # overrides get_points_from_uv, must have its uv_func respected
+        for cls in type(self).__mro__:
+            if "get_points_from_uv" in vars(cls):
+                return True
+            if "uv_func" in vars(cls):
+                return False
+        return False
+
     @Mobject.affects_data
     def init_points(self):
-        # Get three lists:
+        # Get three lists, all evaluated in one batch:
         # - Points generated by pure uv values
         # - Those generated by values nudged by du
         # - Those generated by values nudged by dv
         nu, nv = self.resolution
-        uv_grid = self.get_uv_grid()
-        uv_plus_du = uv_grid.copy()
-        uv_plus_du[:, :, 0] += self.epsilon
-        uv_plus_dv = uv_grid.copy()
-        uv_plus_dv[:, :, 1] += self.epsilon
-
-        points, du_points, dv_points = [
-            np.apply_along_axis(
-                lambda p: self.uv_func(*p), 2, grid
-            ).reshape((nu * nv, self.dim))
-            for grid in (uv_grid, uv_plus_du, uv_plus_dv)
-        ]
+        U, V = np.moveaxis(self.get_uv_grid(), -1, 0)
+        us = np.stack([U, U + self.epsilon, U])
+        vs = np.stack([V, V, V + self.epsilon])
+        if self.has_vectorized_uv_func():
+            all_points = self.get_points_from_uv(us, vs)
+        else:
+            all_points = Surface.get_points_from_uv(self, us, vs)
+        points, du_points, dv_points = np.reshape(all_points, (3, nu * nv, self.dim))
         crosses = cross(du_points - points, dv_points - points)
         normals = normalize_along_axis(crosses, 1)
 
@@ -144,21 +169,95 @@ class Surface(Mobject):
         # TODO, if there is an event which changes
         # the resolution of the surface, make sure
         # this is called.
-        nu, nv = self.resolution
-        if nu == 0 or nv == 0:
-            self.triangle_indices = np.zeros(0, dtype=int)
-            return self.triangle_indices
-        index_grid = np.arange(nu * nv).reshape((nu, nv))
-        indices = np.zeros(6 * (nu - 1) * (nv - 1), dtype=int)
-        indices[0::6] = index_grid[:-1, :-1].flatten()  # Top left
-        indices[1::6] = index_grid[+1:, :-1].flatten()  # Bottom left
-        indices[2::6] = index_grid[:-1, +1:].flatten()  # Top right
-        indices[3::6] = index_grid[:-1, +1:].flatten()  # Top right
-        indices[4::6] = index_grid[+1:, :-1].flatten()  # Bottom left
-        indices[5::6] = index_grid[+1:, +1:].flatten()  # Bottom right
-        self.triangle_indices = indices
+        self.lod_level = 0
+        self.lod_triangle_indices = dict()
+        self.triangle_indices = self.get_lod_triangle_indices(0)
         return self.triangle_indices
 
+    def get_lod_grid_indices(self, n: int, level: int) -> np.ndarray:
+        """
+        Which of n samples along one axis are kept at the given level of
+        detail, namely every (2**level)th along with the last one, though
+        never fewer than min_lod_samples of them
+        """
+        max_stride = max(1, (n - 1) // max(self.min_lod_samples - 1, 1))
+        stride = min(2**level, max_stride)
+        return np.unique([*range(0, n, stride), n - 1]) if n > 0 else np.zeros(0, dtype=int)
+
+    def get_num_lod_levels(self) -> int:
+        nu, nv = self.resolution
+        max_stride = max(1, (max(nu, nv) - 1) // max(self.min_lod_samples - 1, 1))
+        return 1 + int(np.ceil(np.log2(max_stride)))
+
+    def get_lod_triangle_indices(self, level: int) -> np.ndarray:
+        # Level 0 uses every sample, and each level after skips half
+        # the rows and columns of the one before. Points are kept at full
+        # resolution, so coarser levels just triangulate a subgrid of them.
+        # Since shader data is read out through these indices, each level
+        # also sends about a quarter as many vertices as the one before.
+        if level not in self.lod_triangle_indices:
+            nu, nv = self.resolution
+            full_grid = np.arange(nu * nv).reshape((nu, nv))
+            index_grid = full_grid[np.ix_(
+                self.get_lod_grid_indices(nu, level),
+                self.get_lod_grid_indices(nv, level),
+            )]
+            n_rows, n_cols = index_grid.shape
+            indices = np.zeros(6 * max(n_rows - 1, 0) * max(n_cols - 1, 0), dtype=int)
+            indices[0::6] = index_grid[:-1, :-1].flatten()  # Top left
+            indices[1::6] = index_grid[+1:, :-1].flatten()  # Bottom left
+            indices[2::6] = index_grid[:-1, +1:].flatten()  # Top right
+            indices[3::6] = index_grid[:-1, +1:].flatten()  # Top right
+            indices[4::6] = index_grid[+1:, :-1].flatten()  # Bottom left
+            indices[5::6] = index_grid[+1:, +1:].flatten()  # Bottom right
+            self.lod_triangle_indices[level] = indices
+        return self.lod_triangle_indices[level]
+
+    def set_lod_level(self, level: int) -> Self:
+        """
+        Draw from the triangles of the given level. A change of level
+        rewrites this surface's vertex buffer, at the size of the new
+        level, so the updater from use_level_of_detail only pays for that
+        on frames where the apparent size crosses a power of two
+        """
+        level = int(np.clip(level, 0, self.get_num_lod_levels() - 1))
+        if level != self.lod_level:
+            self.lod_level = level
+            # Copied, since sort_faces_back_to_front works in place
+            self.triangle_indices = self.get_lod_triangle_indices(level).copy()
+            self.note_changed_data()
+        return self
+
+    def get_lod_level_for_frame(self, frame: CameraFrame, full_detail_size: float = 0.25) -> int:
+        """
+        Level of detail appropriate to how large this surface appears as
+        seen from frame, with full resolution used while its bounding sphere
+        spans at least half of full_detail_size times the height of the frame,
+        and each halving of its apparent size below that dropping one level.
+        With the default, a unit sphere in the default frame keeps level 0
+        """
+        bounding_box = self.get_bounding_box()
+        radius = 0.5 * get_norm(bounding_box[2] - bounding_box[0])
+        if self.is_fixed_in_frame():
+            distance = frame.get_focal_distance()
+        else:
+            distance = get_norm(frame.get_implied_camera_location() - self.get_center())
+        if radius == 0 or distance == 0:
+            return 0
+        apparent_size = radius / (distance * np.tan(0.5 * frame.get_field_of_view()))
+        return max(0, int(np.floor(np.log2(full_detail_size / apparent_size))))
+
+    def use_level_of_detail(self, frame: CameraFrame, full_detail_size: float = 0.25) -> Self:
+        """
+        Each frame, draw this surface from a subgrid of its points whose
+        resolution matches its apparent size, as seen from frame. See
+        get_lod_level_for_frame.
+        """
+        def updater(surface: Surface):
+            surface.set_lod_level(surface.get_lod_level_for_frame(frame, full_detail_size))
+        self.add_updater(updater)
+        return self
+
     def get_triangle_indices(self) -> np.ndarray:
         return self.triangle_indices
 
@@ -238,6 +337,7 @@ class Surface(Mobject):
         indices = np.argsort(dots)
         for k in range(3):
             tri_is[k::3] = tri_is[k::3][indices]
+        self.note_changed_data()
         return self
 
     def always_sort_to_camera(self, camera: Camera) -> Self:
@@ -265,14 +365,50 @@ class ParametricSurface(Surface):
         uv_func: Callable[[float, float], Iterable[float]],
         u_range: tuple[float, float] = (0, 1),
         v_range: tuple[float, float] = (0, 1),
+        # If True, uv_func is first tried on whole arrays of u and v
+        # values at once, falling back to one call per point if that
+        # fails or disagrees with calls on single values
+        use_vectorized_sampling: bool = False,
         **kwargs
     ):
         self.passed_uv_func = uv_func
+        self.use_vectorized_sampling = use_vectorized_sampling
         super().__init__(u_range=u_range, v_range=v_range, **kwargs)
 
     def uv_func(self, u, v):
         return self.passed_uv_func(u, v)
 
+    def get_points_from_uv(self, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+        if self.use_vectorized_sampling:
+            points = self.get_points_from_vectorized_uv_func(u, v)
+            if points is not None:
+                return points
+        return super().get_points_from_uv(u, v)
+
+    def get_points_from_vectorized_uv_func(self, u: np.ndarray, v: np.ndarray) -> np.ndarray | None:
+        # Accepts either a sequence of coordinates, each an array
+        # or a constant, or an array of points
+        shape = (*u.shape, self.dim)
+        try:
+            output = self.passed_uv_func(u, v)
+            coords = np.broadcast_arrays(*output)
+            if len(coords) == self.dim and coords[0].shape == u.shape:
+                points = np.stack(coords, axis=-1)
+            elif isinstance(output, np.ndarray) and output.shape == shape:
+                points = output
+            else:
+                return None
+            # Catch functions which accept arrays, but treat them
+            # differently from the single values they were written for
+            for index in [0, -1]:
+                u0, v0 = u.flat[index], v.flat[index]
+                point = points.reshape((-1, self.dim))[index]
+                if not np.allclose(point, self.passed_uv_func(u0, v0), equal_nan=True):
+                    return None
+        except Exception:
+            return None
+        return points.astype(float)
+
 
 class SGroup(Surface):
     def __init__(
@@ -26,6 +26,7 @@ from manimlib.utils.bezier import find_intersection
 from manimlib.utils.bezier import outer_interpolate
 from manimlib.utils.bezier import partial_quadratic_bezier_points
 from manimlib.utils.bezier import quadratic_bezier_points_for_arc
+from manimlib.utils.bezier import subdivide_quadratic_bezier_points
 from manimlib.utils.color import color_gradient
 from manimlib.utils.color import rgb_to_hex
 from manimlib.utils.iterables import make_even
@@ -415,6 +416,7 @@ class VMobject(Mobject):
     def set_joint_type(self, joint_type: str, recurse: bool = True) -> Self:
         for mob in self.get_family(recurse):
             mob.uniforms["joint_type"] = self.joint_type_map[joint_type]
+        self.note_changed_uniforms()
         return self
 
     def get_joint_type(self) -> float:
@@ -452,6 +454,7 @@ class VMobject(Mobject):
             self.clear_points()
             return self
         assert len(anchors) == len(handles) + 1
+        self.own_data()
         points = resize_array(self.get_points(), 2 * len(anchors) - 1)
         points[0::2] = anchors
         points[1::2] = handles
@@ -640,8 +643,16 @@ class VMobject(Mobject):
         return self
 
     def add_points_as_corners(self, points: Iterable[Vect3]) -> Self:
-        for point in points:
-            self.add_line_to(point)
+        # Equivalent to add_line_to for each point, with one append
+        points = np.array(list(points), dtype=float).reshape((-1, self.dim))
+        if len(points) == 0:
+            return self
+        self.throw_error_if_no_points()
+        anchors = np.vstack([self.get_last_point(), points])
+        alphas = np.linspace(0, 1, 5 if self.long_lines else 3)[1:, np.newaxis]
+        starts = anchors[:-1, np.newaxis, :]
+        ends = anchors[1:, np.newaxis, :]
+        self.append_points(((1 - alphas) * starts + alphas * ends).reshape((-1, self.dim)))
         return self
 
     def set_points_as_corners(self, points: Iterable[Vect3]) -> Self:
@@ -898,6 +909,7 @@ class VMobject(Mobject):
         else:
             p = self.get_points()
             normal = get_unit_normal(p[1] - p[0], p[2] - p[1])
+        self.own_data()
         self.data["base_normal"][1::2] = normal
         self.needs_new_unit_normal = False
         return normal
@@ -941,10 +953,7 @@ class VMobject(Mobject):
         subpaths1 = self.get_subpaths()
         subpaths2 = vmobject.get_subpaths()
         for subpaths in [subpaths1, subpaths2]:
-            subpaths.sort(key=lambda sp: -sum(
-                get_norm(p2 - p1)
-                for p1, p2 in zip(sp, sp[1:])
-            ))
+            subpaths.sort(key=lambda sp: -poly_line_length(sp))
         n_subpaths = max(len(subpaths1), len(subpaths2))
 
         # Start building new ones
@@ -988,32 +997,46 @@ class VMobject(Mobject):
         if len(points) == 1:
             return np.repeat(points, 2 * n + 1, 0)
 
-        bezier_tuples = list(self.get_bezier_tuples_from_points(points))
+        anchors, handles, next_anchors = points[0:-1:2], points[1::2], points[2::2]
         atol = self.tolerance_for_point_equality
-        norms = [
-            0 if get_norm(tup[1] - tup[0]) < atol else get_norm(tup[2] - tup[0])
-            for tup in bezier_tuples
-        ]
-        # Calculate insertions per curve (ipc)
-        ipc = np.zeros(len(bezier_tuples), dtype=int)
-        for _ in range(n):
-            index = np.argmax(norms)
-            ipc[index] += 1
-            norms[index] *= ipc[index] / (ipc[index] + 1)
-
-        new_points = [points[0]]
-        for tup, n_inserts in zip(bezier_tuples, ipc):
-            # What was once a single quadratic curve defined
-            # by "tup" will now be broken into n_inserts + 1
-            # smaller quadratic curves
-            alphas = np.linspace(0, 1, n_inserts + 2)
-            for a1, a2 in zip(alphas, alphas[1:]):
-                new_points.extend(partial_quadratic_bezier_points(tup, a1, a2)[1:])
-        return np.vstack(new_points)
+        norms = np.linalg.norm(next_anchors - anchors, axis=1)
+        norms[np.linalg.norm(handles - anchors, axis=1) < atol] = 0
+
+        # Calculate insertions per curve (ipc), with the same result as handing
+        # them out one at a time, each to the curve whose pieces are longest
+        ipc = np.zeros(len(norms), dtype=int)
+        total = norms.sum()
+        if total == 0:
+            ipc[0] = n
+        elif n > 0:
+            # Each curve gets at least its proportional share, rounded down,
+            # which is shrunk slightly so as to never round up by mistake
+            ipc[:] = np.floor(norms * (n / total) * (1 - 1e-9))
+            remainder = n - ipc.sum()
+            if remainder > 0:
+                # The rest go to the longest of the pieces that further insertions
+                # would produce, ties going to earlier curves. Only those at least
+                # as long as the remainder-th longest next piece are candidates.
+                next_lengths = norms / (ipc + 1)
+                threshold = np.partition(next_lengths, -remainder)[-remainder]
+                counts = np.maximum(
+                    np.floor(norms / threshold).astype(int) - ipc,
+                    (next_lengths >= threshold).astype(int),
+                )
+                curve_indices = np.repeat(np.arange(len(norms)), counts)
+                offsets = np.arange(len(curve_indices)) - np.repeat(np.cumsum(counts) - counts, counts)
+                lengths = norms[curve_indices] / (ipc[curve_indices] + 1 + offsets)
+                chosen = curve_indices[np.lexsort((curve_indices, -lengths))[:remainder]]
+                ipc += np.bincount(chosen, minlength=len(norms))
+
+        # What was once a single quadratic curve will now be
+        # broken into n_inserts + 1 smaller quadratic curves
+        return subdivide_quadratic_bezier_points(points, ipc + 1)
 
     def pointwise_become_partial(self, vmobject: VMobject, a: float, b: float) -> Self:
         assert isinstance(vmobject, VMobject)
         vm_points = vmobject.get_points()
+        self.own_data()
         self.data["joint_angle"] = vmobject.data["joint_angle"]
         if a <= 0 and b >= 1:
             self.set_points(vm_points, refresh=False)
@@ -1138,6 +1161,7 @@ class VMobject(Mobject):
 
         self.needs_new_joint_angles = False
         self._data_has_changed = True
+        self.own_data()
 
         # Rotate points such that positive z direction is the normal
         points = self.get_points() @ rotation_between_vectors(OUT, self.get_unit_normal())
@@ -1216,6 +1240,7 @@ class VMobject(Mobject):
             if not mob.has_points():
                 continue
             inner_ends = mob.get_subpath_end_indices()[:-1]
+            mob.own_data()
             mob.data["point"][inner_ends + 1] = mob.data["point"][inner_ends + 2]
             mob.data["base_normal"][1::2] *= -1  # Invert normal vector
             self.subpath_end_indices = None
@@ -1288,11 +1313,13 @@ class VMobject(Mobject):
         super().refresh_shader_wrapper_id()
         return self
 
-    def get_shader_data(self) -> np.ndarray:
+    def refresh_shader_data(self) -> None:
         # Do we want this elsewhere? Say whenever points are refreshed or something?
         self.get_joint_angles()
-        self.data["base_normal"][0::2] = self.data["point"][0]
-        return super().get_shader_data()
+        # Only write when needed, so that data shared with a copy stays shared
+        if (self.data["base_normal"][0::2] != self.data["point"][0]).any():
+            self.own_data()
+            self.data["base_normal"][0::2] = self.data["point"][0]
 
     def get_shader_vert_indices(self) -> Optional[np.ndarray]:
         return self.get_outer_vert_indices()
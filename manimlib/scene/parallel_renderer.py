@@ -0,0 +1,235 @@
+"""@file manimlib/scene/parallel_renderer.py
+@brief 按 play 边界把场景拆分到多个进程并行渲染。
+@details 先逐帧预运行场景（不绘制任何画面），得到每次 play 的结束时间，并在每次 play 开始时保存检查点；
+再把动画区间均衡地分配给若干工作进程，每个进程从检查点恢复起始状态，使用独立的 moderngl 上下文渲染一段局部视频，
+最后由 FFmpeg 无损拼接为完整影片，并合入预运行收集的音轨。
+"""
+
+from __future__ import annotations
+
+import copy
+import multiprocessing
+import os
+import shutil
+import subprocess as sp
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from manimlib.logger import log
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from addict import Dict
+
+    from manimlib.scene.scene import Scene
+
+
+def split_plays_by_time(
+    play_end_times: list[float],
+    start: int,
+    end: int,
+    n_segments: int,
+) -> list[tuple[int, int]]:
+    """@brief 将 play 序号区间切分为运行时长大致相等的连续片段。
+    @param play_end_times 每次 play 结束时的场景时间。
+    @details 返回 `(start, end)` 形式的半开区间列表，可直接作为 `-n start,end` 传给工作进程。
+    """
+    start_times = [0.0, *play_end_times[:-1]]
+    durations = [
+        play_end_times[n] - start_times[n]
+        for n in range(start, end)
+    ]
+    total = sum(durations)
+    n_segments = max(min(n_segments, end - start), 1)
+
+    boundaries = [start]
+    elapsed = 0.0
+    for index, duration in zip(range(start, end), durations):
+        target = total * len(boundaries) / n_segments
+        if elapsed >= target and index > boundaries[-1] and len(boundaries) < n_segments:
+            boundaries.append(index)
+        elapsed += duration
+    boundaries.append(end)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def render_scene_segment(
+    module_file_name: str,
+    scene_name: str,
+    scene_config: Dict,
+    start: int,
+    end: int,
+    output_directory: str,
+    file_name: str,
+) -> str:
+    """@brief 在工作进程中渲染场景的一段 play 区间。
+    @details 重新加载场景所在模块，以 `start_at_animation_number` 与 `end_at_animation_number` 限定区间，
+    并把结果写入指定的局部视频文件。起始状态从预运行保存的检查点恢复，而非以跳帧方式一次性推进 updater；
+    若恢复失败，场景会记录警告，此时该段画面可能与串行渲染不同。工作进程没有窗口，因此会创建独立的离屏上下文。
+    """
+    from manimlib.module_loader import ModuleLoader
+
+    module = ModuleLoader.get_module(module_file_name)
+    scene_class = getattr(module, scene_name)
+
+    scene_config.update(
+        window=None,
+        skip_animations=False,
+        start_at_animation_number=start,
+        end_at_animation_number=end,
+        presenter_mode=False,
+        use_play_checkpoints=True,
+    )
+    scene_config["file_writer_config"].update(
+        write_to_movie=True,
+        subdivide_output=False,
+        save_last_frame=False,
+        output_directory=output_directory,
+        file_name=file_name,
+        open_file_upon_completion=False,
+        show_file_location_upon_completion=False,
+        quiet=True,
+        total_frames=0,
+    )
+    scene = scene_class(**scene_config)
+    scene.run()
+    return str(scene.file_writer.get_movie_file_path())
+
+
+class ParallelSceneRenderer(object):
+    """@brief 以多进程方式渲染单个场景的调度器。
+    @details 对外提供与 Scene 相同的 `run` 入口，便于在 `extract_scene` 返回的场景列表中直接替换。
+    声音由预运行收集，并在拼接后按渲染区间截取、合入影片。
+    """
+    def __init__(
+        self,
+        scene_class: type[Scene],
+        scene_config: Dict,
+        run_config: Dict,
+        n_processes: int,
+    ):
+        self.scene_class = scene_class
+        self.scene_config = scene_config
+        self.run_config = run_config
+        self.n_processes = n_processes
+
+    def __str__(self) -> str:
+        return self.scene_class.__name__
+
+    def prerun(self) -> Scene:
+        """@brief 从头逐帧预运行场景，但不绘制也不写出任何画面。
+        @details 与跳帧预运行不同，updater 按每帧的 dt 推进，因此每次 play 开始时保存的检查点与串行渲染的状态一致，
+        工作进程据此恢复起始状态。预运行同时收集 `add_sound` 添加的声音。
+        """
+        pre_config = copy.deepcopy(self.scene_config)
+        pre_config.update(
+            window=None,
+            skip_animations=False,
+            start_at_animation_number=None,
+            presenter_mode=False,
+            use_play_checkpoints=True,
+        )
+        pre_config["file_writer_config"].update(
+            write_to_movie=False,
+            save_last_frame=False,
+            quiet=True,
+        )
+        pre_scene = self.scene_class(**pre_config)
+        pre_scene.suppress_frame_output = True
+        pre_scene.run()
+        return pre_scene
+
+    def run(self) -> None:
+        pre_scene = self.prerun()
+        file_writer = pre_scene.file_writer
+        movie_file_path = file_writer.init_movie_file_path()
+        segment_directory = file_writer.init_partial_movie_directory()
+
+        start = self.scene_config.get("start_at_animation_number") or 0
+        end = pre_scene.end_at_animation_number or pre_scene.num_plays
+        end = min(end, len(pre_scene.play_end_times))
+        segments = split_plays_by_time(pre_scene.play_end_times, start, end, self.n_processes)
+        if not segments or segments[0][0] >= segments[0][1]:
+            log.warning(f"{self} has no animations to render in parallel")
+            return
+
+        log.info(f"Rendering {self} as {len(segments)} segments across {self.n_processes} processes")
+        segment_paths = self.render_segments(segments, segment_directory)
+        self.concatenate_segments(
+            segment_paths, movie_file_path, segment_directory,
+            ffmpeg_bin=file_writer.ffmpeg_bin,
+        )
+        file_writer.movie_file_path = str(movie_file_path)
+        file_writer.write_to_movie = True
+        if file_writer.includes_sound:
+            # Sounds were placed at scene times, while the movie starts at play start
+            start_time = pre_scene.play_end_times[start - 1] if start > 0 else 0
+            file_writer.audio_segment = file_writer.audio_segment[int(1000 * start_time):]
+            file_writer.add_sound_to_video()
+        file_writer.print_file_ready_message(movie_file_path)
+        if file_writer.should_open_file():
+            file_writer.open_file()
+
+    def render_segments(
+        self,
+        segments: list[tuple[int, int]],
+        segment_directory: Path,
+    ) -> list[str]:
+        # Spawn rather than fork, so that each worker builds a fresh OpenGL context
+        mp_context = multiprocessing.get_context("spawn")
+        scene_name = self.scene_class.__name__
+        with ProcessPoolExecutor(self.n_processes, mp_context=mp_context) as executor:
+            futures = [
+                executor.submit(
+                    render_scene_segment,
+                    self.run_config.file_name,
+                    scene_name,
+                    self.scene_config,
+                    start,
+                    end,
+                    str(segment_directory),
+                    f"{scene_name}_{start:05}_{end:05}",
+                )
+                for start, end in segments
+            ]
+            return [future.result() for future in futures]
+
+    def concatenate_segments(
+        self,
+        segment_paths: list[str],
+        movie_file_path: Path,
+        segment_directory: Path,
+        ffmpeg_bin: str = "ffmpeg",
+    ) -> None:
+        """@brief 使用 FFmpeg concat 分离器无损拼接局部视频。
+        @details 各段编码参数一致，因此可以直接复制视频流而无需重新编码。
+        仅在拼接成功后删除局部视频；失败时记录 FFmpeg 的错误输出并抛出 `CalledProcessError`，保留各段文件。
+        """
+        list_file_path = Path(segment_directory, "segments.txt")
+        with open(list_file_path, "w") as fp:
+            for path in segment_paths:
+                fp.write(f"file '{Path(path).absolute().as_posix()}'\n")
+
+        result = sp.run([
+            ffmpeg_bin,
+            '-y',  # overwrite output file if it exists
+            '-f', 'concat',
+            '-safe', '0',
+            '-i', str(list_file_path),
+            '-c', 'copy',
+            '-loglevel', 'error',
+            str(movie_file_path),
+        ], stderr=sp.PIPE)
+        if result.returncode != 0:
+            # Keep the segments, so that nothing rendered is lost
+            log.error(
+                f"Concatenating partial movies failed, they remain in {segment_directory}:\n"
+                + result.stderr.decode(errors="replace")
+            )
+            raise sp.CalledProcessError(result.returncode, result.args, stderr=result.stderr)
+        os.remove(list_file_path)
+        for path in segment_paths:
+            os.remove(path)
+        if not any(segment_directory.iterdir()):
+            shutil.rmtree(segment_directory)
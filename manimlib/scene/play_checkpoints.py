@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import inspect
+import pickle
+import random
+
+import numpy as np
+
+from manimlib.utils.cache import get_cached_value
+from manimlib.utils.cache import has_cached_value
+from manimlib.utils.cache import set_cached_value
+from manimlib.utils.hashing import hash_values
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from manimlib.mobject.mobject import Mobject
+    from manimlib.scene.scene import Scene
+
+
+def get_scene_source_hash(scene: Scene) -> str:
+    """
+    Hash of the source files defining the scene's class and its bases
+    outside of manimlib, together with the library version and the pixel
+    shape, which determines the shape of the camera frame
+    """
+    from manimlib import __version__
+
+    sources = []
+    for cls in type(scene).__mro__:
+        if cls.__module__.split(".")[0] in ("manimlib", "builtins"):
+            continue
+        try:
+            path = inspect.getsourcefile(cls)
+        except TypeError:
+            continue
+        if path is not None and path not in sources:
+            sources.append(path)
+    contents = []
+    for path in sources:
+        with open(path, "rb") as fp:
+            contents.append(fp.read())
+    return hash_values(contents, __version__, scene.camera.get_pixel_shape())
+
+
+def get_family_snapshot(mobject: Mobject) -> list[tuple[str, np.ndarray, dict, np.ndarray]]:
+    return [
+        (
+            type(mob).__qualname__,
+            mob.data.copy(),
+            {
+                key: value.copy() if isinstance(value, np.ndarray) else value
+                for key, value in mob.uniforms.items()
+            },
+            mob.bounding_box.copy(),
+        )
+        for mob in mobject.get_family()
+    ]
+
+
+def matches_snapshot(mobject: Mobject, snapshot: list[tuple]) -> bool:
+    family = mobject.get_family()
+    return len(family) == len(snapshot) and all(
+        type(mob).__qualname__ == name and mob.data.dtype == data.dtype
+        for mob, (name, data, uniforms, bounding_box) in zip(family, snapshot)
+    )
+
+
+class PlayCheckpointStore(object):
+    """
+    Saves the state of a scene at the start of each play or wait call into
+    the disk cache, keyed by the hash of the scene's source, so that a later
+    run starting at animation N can jump straight to that state, rather than
+    reaching it by applying each skipped animation's updaters in one big step.
+
+    Only the data, uniforms and bounding boxes of mobjects in the scene are
+    stored, rather than pickled mobjects, whose updaters and other attributes
+    are often functions that can't be pickled. Restoring therefore requires
+    the scene to hold mobjects of the same types and family structure as
+    when the checkpoint was saved, which holds when the same construct code
+    runs up to that play.
+    """
+    def __init__(self, scene: Scene):
+        self.scene_name = str(scene)
+        self.source_hash = get_scene_source_hash(scene)
+
+    def get_key(self, num_plays: int) -> str:
+        return f"play_checkpoint:{self.scene_name}:{self.source_hash}:{num_plays}"
+
+    def has_checkpoint(self, num_plays: int) -> bool:
+        return has_cached_value(self.get_key(num_plays))
+
+    def save(self, scene: Scene) -> None:
+        """
+        Save the state of the scene at the start of its current play,
+        replacing any checkpoint saved there before. Only call this when
+        that state is known to match a full render, since it will be
+        restored as is.
+        """
+        checkpoint = dict(
+            time=scene.time,
+            play_end_times=list(scene.play_end_times),
+            random_state=random.getstate(),
+            np_random_state=np.random.get_state(),
+            snapshots=list(map(get_family_snapshot, scene.mobjects)),
+        )
+        set_cached_value(
+            self.get_key(scene.num_plays),
+            pickle.dumps(checkpoint, protocol=pickle.HIGHEST_PROTOCOL),
+        )
+
+    def restore(self, scene: Scene) -> bool:
+        """
+        Put the scene into the state saved at the start of its current
+        play. Returns False, changing nothing, if there is no such
+        checkpoint or its mobjects don't match those of the scene.
+        """
+        value = get_cached_value(self.get_key(scene.num_plays))
+        if value is None:
+            return False
+        checkpoint: dict[str, Any] = pickle.loads(value)
+        snapshots = checkpoint["snapshots"]
+        if len(snapshots) != len(scene.mobjects):
+            return False
+        if not all(map(matches_snapshot, scene.mobjects, snapshots)):
+            return False
+
+        for mobject, snapshot in zip(scene.mobjects, snapshots):
+            for mob, (name, data, uniforms, bounding_box) in zip(mobject.get_family(), snapshot):
+                mob.set_data(data)
+                mob.set_uniforms(uniforms)
+                mob.bounding_box[:] = bounding_box
+        scene.time = checkpoint["time"]
+        scene.play_end_times = checkpoint["play_end_times"]
+        random.setstate(checkpoint["random_state"])
+        np.random.set_state(checkpoint["np_random_state"])
+        return True
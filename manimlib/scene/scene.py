@@ -12,6 +12,7 @@ import time
 from functools import wraps
 from contextlib import contextmanager
 from contextlib import ExitStack
+from contextlib import nullcontext
 
 import numpy as np
 from tqdm.auto import tqdm as ProgressDisplay
@@ -32,11 +33,14 @@ from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.scene.scene_embed import InteractiveSceneEmbed
 from manimlib.scene.scene_embed import CheckpointManager
+from manimlib.scene.play_checkpoints import PlayCheckpointStore
 from manimlib.scene.scene_file_writer import SceneFileWriter
 from manimlib.utils.dict_ops import merge_dicts_recursively
 from manimlib.utils.family_ops import extract_mobject_family_members
 from manimlib.utils.family_ops import recursive_mobject_remove
+from manimlib.utils.hashing import hash_values
 from manimlib.utils.iterables import batch_by_property
+from manimlib.utils.profiling import profiler
 from manimlib.utils.sounds import play_sound
 from manimlib.utils.color import color_to_rgba
 from manimlib.window import Window
@@ -83,6 +87,7 @@ class Scene(object):
         preview_while_skipping: bool = True,
         presenter_mode: bool = False,
         default_wait_time: float = 1.0,
+        use_play_checkpoints: bool = False,
     ):
         self.skip_animations = skip_animations
         self.always_update_mobjects = always_update_mobjects
@@ -126,14 +131,31 @@ class Scene(object):
         self.render_groups: list[Mobject] = []
         self.id_to_mobject_map: dict[int, Mobject] = dict()
         self.num_plays: int = 0
+        self.play_end_times: list[float] = []
         self.time: float = 0
         self.skip_time: float = 0
         self.original_skipping_status: bool = self.skip_animations
+        # Set while replaying a play whose partial movie was cached, which
+        # advances frame by frame as usual, but captures and writes nothing
+        self.suppress_frame_output: bool = False
         self.undo_stack = []
         self.redo_stack = []
 
         if self.start_at_animation_number is not None:
             self.skip_animations = True
+        self.play_checkpoints = PlayCheckpointStore(self) if use_play_checkpoints else None
+        # When seeking, skipped plays don't run updaters, since the state
+        # at the starting animation is restored from a checkpoint instead
+        self.seeking = bool(
+            self.play_checkpoints is not None
+            and self.start_at_animation_number is not None
+            and self.play_checkpoints.has_checkpoint(self.start_at_animation_number)
+        )
+        # Whether the state of the scene matches what rendering every play
+        # from the start would give, which is no longer the case once a play
+        # is skipped, unless a checkpoint is restored. Only then are
+        # checkpoints saved.
+        self.has_accurate_state: bool = True
         if self.file_writer.has_progress_display():
             self.show_animation_progress = False
 
@@ -190,6 +212,11 @@ class Scene(object):
     def tear_down(self) -> None:
         self.stop_skipping()
         self.file_writer.finish()
+        if profiler.enabled:
+            profiler.write_report(
+                str(self),
+                manim_config.profiling.output_directory or self.file_writer.output_directory,
+            )
         if self.window:
             self.window.destroy()
             self.window = None
@@ -251,8 +278,9 @@ class Scene(object):
         @details 该方法会更新时间、触发所有 Mobject 的 updater、执行窗口事件循环，并最终让相机捕获当前 `render_groups`。
         """
         self.increment_time(dt)
-        self.update_mobjects(dt)
-        if self.skip_animations and not force_draw:
+        with profiler.section("update_mobjects"):
+            self.update_mobjects(dt)
+        if (self.skip_animations or self.suppress_frame_output) and not force_draw:
             return
 
         if self.is_window_closing():
@@ -264,7 +292,8 @@ class Scene(object):
             self.window._window.dispatch_events()
             return
 
-        self.camera.capture(*self.render_groups)
+        with profiler.section("capture"):
+            self.camera.capture(*self.render_groups)
 
         if self.window and not self.skip_animations:
             vt = self.time - self.virtual_animation_start_time
@@ -275,12 +304,14 @@ class Scene(object):
         """@brief 将当前相机缓冲写入输出。
         @details 当未跳过动画时，调用 `SceneFileWriter.write_frame` 把 FBO 数据写入视频管线或图像文件。
         """
-        if not self.skip_animations:
+        if not self.skip_animations and not self.suppress_frame_output:
             self.file_writer.write_frame(self.camera)
 
     # Related to updating
 
     def update_mobjects(self, dt: float) -> None:
+        if self.seeking:
+            return
         for mobject in self.mobjects:
             mobject.update(dt)
 
@@ -467,6 +498,8 @@ class Scene(object):
     def update_skipping_status(self) -> None:
         if self.start_at_animation_number is not None:
             if self.num_plays == self.start_at_animation_number:
+                if self.seeking:
+                    self.restore_play_checkpoint()
                 self.skip_time = self.time
                 if not self.original_skipping_status:
                     self.stop_skipping()
@@ -474,6 +507,17 @@ class Scene(object):
             if self.num_plays >= self.end_at_animation_number:
                 raise EndScene()
 
+    def restore_play_checkpoint(self) -> None:
+        self.seeking = False
+        self.has_accurate_state = self.play_checkpoints.restore(self)
+        if self.has_accurate_state:
+            log.info(f"Restored {self} at animation {self.num_plays} from a checkpoint")
+        else:
+            log.warning(
+                f"The checkpoint of {self} at animation {self.num_plays} could not be "
+                "restored, and updaters were not run while skipping to it"
+            )
+
     def stop_skipping(self) -> None:
         self.virtual_animation_start_time = self.time
         self.real_animation_start_time = time.time()
@@ -539,6 +583,9 @@ class Scene(object):
 
         self.update_skipping_status()
 
+        if self.play_checkpoints is not None and self.has_accurate_state and not self.skip_animations:
+            self.play_checkpoints.save(self)
+
         if not self.skip_animations:
             self.file_writer.begin_animation()
 
@@ -554,8 +601,38 @@ class Scene(object):
             # Show some quick frames along the way
             self.update_frame(dt=0, force_draw=True)
 
+        if self.skip_animations:
+            self.has_accurate_state = False
+        self.play_end_times.append(self.time)
         self.num_plays += 1
 
+    def get_play_cache_key(self, *items) -> str:
+        """@brief 计算一次 play 的内容寻址缓存键。
+        @details 键由场景中所有 Mobject 的数据、传入的动画或其他参数、相机配置与编码参数共同决定，
+        任何影响输出帧的改动都会得到不同的键。
+        函数按其字节码、闭包、默认参数以及所引用的模块级全局变量计算哈希；但对象属性、类属性以及超过
+        `hash_values` 递归深度的内容不参与计算，若 updater 依赖这些状态，修改后仍可能命中旧缓存。
+        """
+        camera = self.camera
+        return hash_values(
+            self.mobjects,
+            items,
+            camera.get_pixel_shape(),
+            camera.fps,
+            camera.samples,
+            tuple(camera.background_rgba),
+            self.file_writer.get_encoding_signature(),
+        )
+
+    def use_cached_play(self, *items) -> bool:
+        """@brief 若本次 play 的局部视频已缓存，则复用之。
+        @details 仅在分段输出且开启 `cache_partial_movies` 时计算缓存键；返回 True 表示调用方应在
+        `temp_suppress_frame_output` 中照常逐帧推进动画，仅不再捕获与写出画面，使之后的场景状态与实际渲染一致。
+        """
+        if not self.file_writer.awaiting_partial_movie_key:
+            return False
+        return self.file_writer.use_partial_movie_key(self.get_play_cache_key(*items))
+
     def begin_animations(self, animations: Iterable[Animation]) -> None:
         """@brief 初始化动画并将相关对象加入场景。
         @details 调用每个动画的 `begin`，并确保待播放的 Mobject 均存在于场景树中。
@@ -580,12 +657,14 @@ class Scene(object):
         for t in self.get_animation_time_progression(animations):
             dt = t - last_t
             last_t = t
-            for animation in animations:
-                animation.update_mobjects(dt)
-                alpha = t / animation.run_time
-                animation.interpolate(alpha)
-            self.update_frame(dt)
-            self.emit_frame()
+            with profiler.frame():
+                with profiler.section("interpolate"):
+                    for animation in animations:
+                        animation.update_mobjects(dt)
+                        alpha = t / animation.run_time
+                        animation.interpolate(alpha)
+                self.update_frame(dt)
+                self.emit_frame()
 
     def finish_animations(self, animations: Iterable[Animation]) -> None:
         for animation in animations:
@@ -613,11 +692,15 @@ class Scene(object):
         animations = list(map(prepare_animation, proto_animations))
         for anim in animations:
             anim.update_rate_info(run_time, rate_func, lag_ratio)
-        self.pre_play()
-        self.begin_animations(animations)
-        self.progress_through_animations(animations)
-        self.finish_animations(animations)
-        self.post_play()
+        play_name = ", ".join(type(anim).__name__ for anim in animations)
+        with profiler.play(f"{self.num_plays}: {play_name}"):
+            self.pre_play()
+            self.begin_animations(animations)
+            cached = self.use_cached_play(*animations)
+            with self.temp_suppress_frame_output() if cached else nullcontext():
+                self.progress_through_animations(animations)
+                self.finish_animations(animations)
+            self.post_play()
 
     def wait(
         self,
@@ -628,23 +711,27 @@ class Scene(object):
     ):
         if duration is None:
             duration = self.default_wait_time
-        self.pre_play()
-        self.update_mobjects(dt=0)  # Any problems with this?
-        if self.presenter_mode and not self.skip_animations and not ignore_presenter_mode:
-            if note:
-                log.info(note)
-            self.hold_loop()
-        else:
-            time_progression = self.get_wait_time_progression(duration, stop_condition)
-            last_t = 0
-            for t in time_progression:
-                dt = t - last_t
-                last_t = t
-                self.update_frame(dt)
-                self.emit_frame()
-                if stop_condition is not None and stop_condition():
-                    break
-        self.post_play()
+        with profiler.play(f"{self.num_plays}: Wait"):
+            self.pre_play()
+            self.update_mobjects(dt=0)  # Any problems with this?
+            if self.presenter_mode and not self.skip_animations and not ignore_presenter_mode:
+                if note:
+                    log.info(note)
+                self.hold_loop()
+            else:
+                cached = stop_condition is None and self.use_cached_play("wait", duration)
+                with self.temp_suppress_frame_output() if cached else nullcontext():
+                    time_progression = self.get_wait_time_progression(duration, stop_condition)
+                    last_t = 0
+                    for t in time_progression:
+                        dt = t - last_t
+                        last_t = t
+                        with profiler.frame():
+                            self.update_frame(dt)
+                            self.emit_frame()
+                        if stop_condition is not None and stop_condition():
+                            break
+            self.post_play()
 
     def hold_loop(self):
         while self.hold_on_wait:
@@ -718,6 +805,15 @@ class Scene(object):
             if not prev_status:
                 self.stop_skipping()
 
+    @contextmanager
+    def temp_suppress_frame_output(self):
+        prev_status = self.suppress_frame_output
+        self.suppress_frame_output = True
+        try:
+            yield
+        finally:
+            self.suppress_frame_output = prev_status
+
     @contextmanager
     def temp_progress_bar(self):
         prev_progress = self.show_animation_progress
@@ -914,14 +1010,20 @@ class SceneState():
             for mob in ignore:
                 self.mobjects_to_copies.pop(mob, None)
 
-        last_m2c = scene.undo_stack[-1].mobjects_to_copies if scene.undo_stack else dict()
+        # Versions of each mobject's family at the time of this state
+        self.mobject_versions = {
+            mob: mob.get_family_version()
+            for mob in self.mobjects_to_copies
+        }
+
+        last_state = scene.undo_stack[-1] if scene.undo_stack else None
         for mob in self.mobjects_to_copies:
             # If it hasn't changed since the last state, just point to the
             # same copy as before
-            if mob in last_m2c and last_m2c[mob].looks_identical(mob):
-                self.mobjects_to_copies[mob] = last_m2c[mob]
+            if last_state is not None and last_state.has_same_version(mob, self):
+                self.mobjects_to_copies[mob] = last_state.mobjects_to_copies[mob]
             else:
-                self.mobjects_to_copies[mob] = mob.copy()
+                self.mobjects_to_copies[mob] = mob.copy(share_data=True)
 
     def __eq__(self, state: SceneState):
         return all((
@@ -933,10 +1035,13 @@ class SceneState():
     def mobjects_match(self, state: SceneState):
         return self.mobjects_to_copies == state.mobjects_to_copies
 
+    def has_same_version(self, mob: Mobject, state: SceneState) -> bool:
+        return mob in self.mobject_versions and \
+            self.mobject_versions[mob] == state.mobject_versions[mob]
+
     def n_changes(self, state: SceneState):
-        m2c = state.mobjects_to_copies
         return sum(
-            1 - int(mob in m2c and mob.looks_identical(m2c[mob]))
+            1 - int(state.has_same_version(mob, self))
             for mob in self.mobjects_to_copies
         )
 
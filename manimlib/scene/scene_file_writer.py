@@ -7,9 +7,11 @@ from __future__ import annotations
 
 import os
 import platform
+import queue
 import shutil
 import subprocess as sp
 import sys
+import threading
 
 import numpy as np
 from pydub import AudioSegment
@@ -18,7 +20,10 @@ from pathlib import Path
 
 from manimlib.logger import log
 from manimlib.mobject.mobject import Mobject
+from manimlib.utils.cache import copy_cached_file
+from manimlib.utils.cache import store_cached_file
 from manimlib.utils.file_ops import guarantee_existence
+from manimlib.utils.profiling import profiler
 from manimlib.utils.sounds import get_full_sound_file_path
 
 from typing import TYPE_CHECKING
@@ -56,6 +61,13 @@ class SceneFileWriter(object):
         pixel_format: str = "yuv420p",
         saturation: float = 1.0,
         gamma: float = 1.0,
+        # If positive, frames are handed to ffmpeg by a background thread
+        # through a queue holding at most this many frames, so that rendering
+        # and encoding run concurrently. If 0, frames are written inline.
+        frame_queue_size: int = 0,
+        # When subdividing output, reuse a previously rendered partial movie
+        # if the state of the scene and the animations for that play match
+        cache_partial_movies: bool = False,
     ):
         self.scene: Scene = scene
         self.write_to_movie = write_to_movie
@@ -75,9 +87,17 @@ class SceneFileWriter(object):
         self.pixel_format = pixel_format
         self.saturation = saturation
         self.gamma = gamma
+        self.frame_queue_size = frame_queue_size
+        self.cache_partial_movies = cache_partial_movies
 
         # State during file writing
         self.writing_process: sp.Popen | None = None
+        self.frame_queue: queue.Queue | None = None
+        self.writer_thread: threading.Thread | None = None
+        self.writer_error: Exception | None = None
+        self.awaiting_partial_movie_key: bool = False
+        self.partial_movie_key: str | None = None
+        self.reused_partial_movie: bool = False
         self.progress_display: ProgressDisplay | None = None
         self.ended_with_interrupt: bool = False
 
@@ -133,6 +153,18 @@ class SceneFileWriter(object):
     def get_movie_file_path(self) -> str:
         return self.movie_file_path
 
+    def get_partial_movie_cache_key(self, key: str) -> str:
+        return f"partial_movie:{key}"
+
+    def get_encoding_signature(self) -> tuple:
+        return (
+            self.movie_file_extension,
+            self.video_codec,
+            self.pixel_format,
+            self.saturation,
+            self.gamma,
+        )
+
     # Sound
     def init_audio(self) -> None:
         self.includes_sound: bool = False
@@ -189,11 +221,49 @@ class SceneFileWriter(object):
 
     def begin_animation(self) -> None:
         if self.subdivide_output and self.write_to_movie:
-            self.open_movie_pipe(self.get_next_partial_movie_path())
+            if self.cache_partial_movies:
+                # The pipe is only opened once the cache key for
+                # this play is known, see use_partial_movie_key
+                self.awaiting_partial_movie_key = True
+            else:
+                self.open_movie_pipe(self.get_next_partial_movie_path())
+
+    def use_partial_movie_key(self, key: str | None) -> bool:
+        """@brief 根据缓存键决定复用缓存的局部视频还是重新渲染。
+        @param key 由播放前场景状态、动画参数与相机配置计算的哈希；为 None 时不使用缓存。
+        @details 命中缓存时直接把缓存文件复制为本次 play 的局部视频并返回 True，调用方应跳过逐帧渲染；
+        否则打开 FFmpeg 管道并返回 False，渲染结束后结果会以该键写入缓存。
+        """
+        if not self.awaiting_partial_movie_key:
+            return False
+        self.awaiting_partial_movie_key = False
+        self.partial_movie_key = key
+        movie_path = self.get_next_partial_movie_path()
+        if key is not None:
+            if copy_cached_file(self.get_partial_movie_cache_key(key), movie_path):
+                self.reused_partial_movie = True
+                return True
+        self.open_movie_pipe(movie_path)
+        return False
 
     def end_animation(self) -> None:
-        if self.subdivide_output and self.write_to_movie:
-            self.close_movie_pipe()
+        if not (self.subdivide_output and self.write_to_movie):
+            return
+        if self.awaiting_partial_movie_key:
+            # No key was ever provided, so nothing was cached
+            self.use_partial_movie_key(None)
+        if self.reused_partial_movie:
+            self.reused_partial_movie = False
+            return
+        self.close_movie_pipe()
+        if self.partial_movie_key is not None and not self.ended_with_interrupt:
+            self.store_partial_movie(self.final_file_path, self.partial_movie_key)
+        self.partial_movie_key = None
+
+    def store_partial_movie(self, movie_path: str | Path, key: str) -> None:
+        # Kept in the disk cache, so these count toward its size limit
+        # and are removed along with everything else by clear_cache
+        store_cached_file(self.get_partial_movie_cache_key(key), movie_path)
 
     def finish(self) -> None:
         if not self.subdivide_output and self.write_to_movie:
@@ -236,6 +306,8 @@ class SceneFileWriter(object):
             command += ['-pix_fmt', self.pixel_format]
         command += [self.temp_file_path]
         self.writing_process = sp.Popen(command, stdin=sp.PIPE)
+        if self.frame_queue_size > 0:
+            self.start_writer_thread()
 
         if not self.quiet:
             self.progress_display = ProgressDisplay(
@@ -292,22 +364,87 @@ class SceneFileWriter(object):
     def write_frame(self, camera: Camera) -> None:
         """@brief 写入一帧图像数据。
         @details 从相机读取 FBO 原始字节流，经由预先打开的 FFmpeg 管道写入视频文件，同时更新进度条。
+        若相机启用了异步读取，写出的是若干帧之前排队的数据，剩余帧在关闭管道时补齐。
         """
         if self.write_to_movie:
-            raw_bytes = camera.get_raw_fbo_data()
+            if self.awaiting_partial_movie_key:
+                self.use_partial_movie_key(None)
+            with profiler.section("get_raw_fbo_data"):
+                raw_bytes = camera.queue_raw_fbo_data()
+            if raw_bytes is not None:
+                with profiler.section("write_frame"):
+                    self.write_raw_bytes(raw_bytes)
+
+    def write_raw_bytes(self, raw_bytes: bytes) -> None:
+        if self.writer_thread is not None:
+            self.raise_writer_error()
+            # Blocks when the queue is full, so rendering can never
+            # run more than frame_queue_size frames ahead of ffmpeg
+            self.frame_queue.put(raw_bytes)
+        else:
             self.writing_process.stdin.write(raw_bytes)
-            if self.progress_display is not None:
-                self.progress_display.update()
+        if self.progress_display is not None:
+            self.progress_display.update()
+
+    def start_writer_thread(self) -> None:
+        """@brief 启动后台写帧线程。
+        @details 帧数据先进入容量为 `frame_queue_size` 的有界队列，再由独立线程写入 FFmpeg 管道，使渲染与编码并行执行。
+        """
+        self.frame_queue = queue.Queue(maxsize=self.frame_queue_size)
+        self.writer_error = None
+        self.writer_thread = threading.Thread(
+            target=self.feed_writing_process,
+            args=(self.writing_process, self.frame_queue),
+            name="SceneFileWriterThread",
+            daemon=True,
+        )
+        self.writer_thread.start()
+
+    def feed_writing_process(self, process: sp.Popen, frame_queue: queue.Queue) -> None:
+        while (raw_bytes := frame_queue.get()) is not None:
+            if self.writer_error is not None:
+                # Keep draining so the render thread never blocks on a dead pipe
+                continue
+            try:
+                process.stdin.write(raw_bytes)
+            except (BrokenPipeError, OSError, ValueError) as err:
+                self.writer_error = err
+
+    def stop_writer_thread(self) -> None:
+        if self.writer_thread is None:
+            return
+        self.frame_queue.put(None)
+        self.writer_thread.join()
+        self.writer_thread = None
+        self.frame_queue = None
+
+    def raise_writer_error(self) -> None:
+        if self.writer_error is not None:
+            err = self.writer_error
+            self.writer_error = None
+            log.error(f"Writing frames to {self.temp_file_path} failed, ffmpeg closed its input pipe")
+            raise err
+
+    def flush_pending_frames(self) -> None:
+        # With asynchronous readback, the camera may still hold
+        # frames which have not yet been handed to ffmpeg
+        for raw_bytes in self.scene.camera.flush_raw_fbo_data():
+            self.write_raw_bytes(raw_bytes)
 
     def close_movie_pipe(self) -> None:
         """@brief 关闭 FFmpeg 管道并整理临时文件。
         @details 停止写入进程、清理进度显示，并将临时输出移动到最终路径；若渲染被中断，则保留中间文件。
         """
+        try:
+            self.flush_pending_frames()
+        finally:
+            self.stop_writer_thread()
         self.writing_process.stdin.close()
         self.writing_process.wait()
         self.writing_process.terminate()
         if self.progress_display is not None:
             self.progress_display.close()
+        self.raise_writer_error()
 
         if not self.ended_with_interrupt:
             shutil.move(self.temp_file_path, self.final_file_path)
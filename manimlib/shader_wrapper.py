@@ -11,6 +11,7 @@ from functools import lru_cache
 
 from manimlib.config import parse_cli
 from manimlib.config import manim_config
+from manimlib.utils.profiling import profiler
 from manimlib.utils.shaders import get_shader_code_from_file
 from manimlib.utils.shaders import get_shader_program
 from manimlib.utils.shaders import image_path_to_texture
@@ -19,7 +20,7 @@ from manimlib.utils.shaders import set_program_uniform
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Optional, Tuple, Iterable
+    from typing import Optional, Tuple, Iterable, Hashable
     from manimlib.typing import UniformDict
     from moderngl.vertex_array import VertexArray
     from moderngl.framebuffer import Framebuffer
@@ -98,6 +99,7 @@ class ShaderWrapper(object):
 
     def init_vertex_objects(self):
         self.vbo = None
+        self.member_keys = None
         self.vaos = []
 
     def add_texture(self, name: str, texture: moderngl.Texture):
@@ -150,28 +152,108 @@ class ShaderWrapper(object):
 
     # Adding data
 
-    def read_in(self, data_list: Iterable[np.ndarray]):
+    def read_in(
+        self,
+        data_list: Iterable[np.ndarray],
+        member_keys: Optional[list[Hashable]] = None,
+    ):
+        """
+        Optionally, member_keys identify where each array of data_list
+        came from, so that write_member_data can later replace some of
+        them, provided holds_members(member_keys) is True.
+        """
+        with profiler.section("read_in"):
+            self.read_in_data(data_list)
+        self.member_keys = None
+        # Only data concatenated into self.vert_data can be updated in place
+        if member_keys is not None and len(data_list) > 1 and self.vbo is not None:
+            self.member_keys = list(member_keys)
+            self.member_offsets = np.cumsum([0, *map(len, data_list)])
+
+    def holds_members(self, member_keys: list[Hashable]) -> bool:
+        return self.member_keys is not None and self.member_keys == member_keys
+
+    def write_member_data(self, member_data: dict[int, np.ndarray]) -> None:
+        """
+        Replace the data of the members with the given indices in the last
+        call to read_in, and upload only the byte ranges that changed, merging
+        runs of adjacent members into one write. If some member's length
+        changed, everything after it moves, so that whole tail is uploaded.
+        """
+        with profiler.section("write_member_data"):
+            offsets = self.member_offsets
+            lengths = np.diff(offsets)
+            resized = [
+                index for index, data in member_data.items()
+                if len(data) != lengths[index]
+            ]
+            if resized:
+                self.splice_member_data(member_data, min(resized))
+                return
+            runs = []
+            for index in sorted(member_data):
+                if runs and runs[-1][-1] == index - 1:
+                    runs[-1].append(index)
+                else:
+                    runs.append([index])
+            for run in runs:
+                start = offsets[run[0]]
+                end = offsets[run[-1] + 1]
+                if start == end:
+                    continue
+                for index in run:
+                    self.vert_data[offsets[index]:offsets[index + 1]] = member_data[index]
+                data = self.vert_data[start:end]
+                self.vbo.write(data, offset=int(start) * data.itemsize)
+                profiler.count("vbo_bytes", data.nbytes)
+
+    def splice_member_data(self, member_data: dict[int, np.ndarray], first_resized: int) -> None:
+        offsets = self.member_offsets
+        pieces = [
+            member_data[index] if index in member_data else self.vert_data[start:end]
+            for index, (start, end) in enumerate(zip(offsets[:-1], offsets[1:]))
+        ]
+        vert_data = np.concatenate(pieces)
+        member_keys = self.member_keys
+        self.vert_data = vert_data
+        if vert_data.nbytes != self.vbo.size:
+            # A buffer of a new size is read in from scratch
+            self.read_in_data([vert_data])
+        else:
+            start = int(offsets[min(first_resized, *member_data)])
+            self.vbo.write(vert_data[start:], offset=start * vert_data.itemsize)
+            profiler.count("vbo_bytes", vert_data[start:].nbytes)
+        self.member_keys = member_keys
+        self.member_offsets = np.cumsum([0, *map(len, pieces)])
+
+    def read_in_data(self, data_list: Iterable[np.ndarray]):
         total_len = sum(map(len, data_list))
         if total_len == 0:
             if self.vbo is not None:
                 self.vbo.clear()
             return
 
-        # If possible, read concatenated data into existing list
-        if len(self.vert_data) != total_len:
-            self.vert_data = np.concatenate(data_list)
+        if len(data_list) == 1 and data_list[0].flags.c_contiguous:
+            # Nothing to concatenate, e.g. for a slice of packed family data
+            vert_data = data_list[0]
         else:
-            np.concatenate(data_list, out=self.vert_data)
+            # If possible, read concatenated data into existing list
+            if len(self.vert_data) != total_len:
+                self.vert_data = np.concatenate(data_list)
+            else:
+                np.concatenate(data_list, out=self.vert_data)
+            vert_data = self.vert_data
 
         # Either create new vbo, or read data into it
-        total_size = self.vert_data.itemsize * total_len
+        total_size = vert_data.itemsize * total_len
         if self.vbo is not None and self.vbo.size != total_size:
             self.release()  # This sets vbo to be None
         if self.vbo is None:
-            self.vbo = self.ctx.buffer(self.vert_data)
+            self.vbo = self.ctx.buffer(vert_data)
             self.generate_vaos()
         else:
-            self.vbo.write(self.vert_data)
+            self.vbo.write(vert_data)
+        profiler.count("vbo_bytes", total_size)
 
     def generate_vaos(self):
         # Vertex array object
@@ -306,6 +388,7 @@ class VShaderWrapper(ShaderWrapper):
 
     def init_vertex_objects(self):
         self.vbo = None
+        self.member_keys = None
         self.stroke_vao = None
         self.fill_vao = None
         self.fill_border_vao = None
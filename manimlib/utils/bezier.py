@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import numpy as np
 from scipy import linalg
+from scipy import sparse
 from fontTools.cu2qu.cu2qu import curve_to_quadratic
 
 from manimlib.logger import log
@@ -91,6 +92,37 @@ def partial_quadratic_bezier_points(
     return [h0, h1, h2]
 
 
+def subdivide_quadratic_bezier_points(
+    points: VectNArray,
+    n_pieces: Sequence[int] | np.ndarray,
+) -> VectNArray:
+    """
+    Given the points of a path of quadratic bezier curves, in the form
+    (anchor, handle, anchor, handle, ..., anchor), break its nth curve
+    into n_pieces[n] curves over equal spans of the parameter, and return
+    the points of the resulting path in the same form.
+
+    All pieces are computed at once, noting that the piece of a curve B
+    over [a, b] has control points B(a, a), B(a, b) and B(b, b), where
+    B(s, t) is the polar form of B.
+    """
+    n_pieces = np.asarray(n_pieces, dtype=int)
+    curve_indices = np.repeat(np.arange(len(n_pieces)), n_pieces)
+    piece_indices = np.arange(len(curve_indices)) - np.repeat(np.cumsum(n_pieces) - n_pieces, n_pieces)
+    denominators = n_pieces[curve_indices]
+    a = (piece_indices / denominators)[:, np.newaxis]
+    b = ((piece_indices + 1) / denominators)[:, np.newaxis]
+    p0 = points[0:-1:2][curve_indices]
+    p1 = points[1::2][curve_indices]
+    p2 = points[2::2][curve_indices]
+
+    result = np.empty((2 * len(curve_indices) + 1, *points.shape[1:]), dtype=points.dtype)
+    result[0] = points[0]
+    result[1::2] = (1 - a) * (1 - b) * p0 + ((1 - a) * b + a * (1 - b)) * p1 + a * b * p2
+    result[2::2] = (1 - b) * (1 - b) * p0 + 2 * (1 - b) * b * p1 + b * b * p2
+    return result
+
+
 # Linear interpolation variants
 
 
@@ -217,6 +249,37 @@ def approx_smooth_quadratic_bezier_handles(
     return handles
 
 
+def approx_smooth_quadratic_bezier_handle_operator(n_anchors: int) -> sparse.csr_matrix:
+    """
+    Sparse matrix which, applied to the anchors of an open path, meaning
+    one whose first and last anchors differ, gives the same handles as
+    approx_smooth_quadratic_bezier_handles. Useful when handles must be
+    found for many sets of anchors with the same length.
+    """
+    n = n_anchors
+    if n < 3:
+        return sparse.csr_matrix(np.full((max(n - 1, 0), n), 0.5))
+    # The handle between anchors j and j + 1 averages a parabola smoothing
+    # to the right, through anchors j, j + 1, j + 2, and one smoothing to the
+    # left, through anchors j + 1, j, j - 1. At either end of the path, the
+    # one which would reach past it is replaced with the other.
+    j = np.arange(n - 1)
+    to_right = np.array([j, j + 1, j + 2])
+    to_left = np.array([j + 1, j, j - 1])
+    cols1 = to_right.copy()
+    cols1[:, -1] = to_left[:, -1]
+    cols2 = to_left.copy()
+    cols2[:, 0] = to_right[:, 0]
+    weights = 0.5 * np.array([0.25, 1, -0.25])
+    return sparse.csr_matrix(
+        (
+            np.repeat(np.tile(weights, 2), n - 1),
+            (np.tile(j, 6), np.hstack([cols1.ravel(), cols2.ravel()])),
+        ),
+        shape=(n - 1, n),
+    )
+
+
 def smooth_quadratic_path(anchors: Vect3Array) -> Vect3Array:
     """
     Returns a path defining a smooth quadratic bezier spline
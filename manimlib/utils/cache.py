@@ -1,34 +1,272 @@
 from __future__ import annotations
 
+import atexit
+import hashlib
+import inspect
+import json
 import os
+import shutil
+import threading
+from collections import OrderedDict
 from diskcache import Cache
+from diskcache import Lock
 from contextlib import contextmanager
 from functools import wraps
 
+from manimlib.config import manim_config
+from manimlib.logger import log
 from manimlib.utils.directories import get_cache_dir
-from manimlib.utils.simple_functions import hash_string
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any, Callable, Iterable, Iterator, TypeVar
     T = TypeVar('T')
 
 
-CACHE_SIZE = 1e9  # 1 Gig
-_cache = Cache(get_cache_dir(), size_limit=CACHE_SIZE)
+# Bump this whenever the format of cached values changes,
+# so that stale entries are no longer found
+CACHE_KEY_VERSION = 2
+# Seconds after which a lock on a key is released, in case
+# the process computing its value died while holding it
+LOCK_EXPIRE = 600
 
+_MISSING = object()
+
+
+class TwoLevelCache(object):
+    """
+    A small in-memory LRU cache in front of a diskcache.Cache, which
+    may be shared by many processes through the same directory.
+
+    The disk tier is opened lazily, and reopened within forked processes,
+    since its sqlite connection should not cross process boundaries.
+    """
+    def __init__(
+        self,
+        directory: str,
+        size_limit: float = 1e9,
+        eviction_policy: str = "least-recently-stored",
+        memory_size: int = 256,
+    ):
+        self.directory = directory
+        self.size_limit = int(float(size_limit))
+        self.eviction_policy = eviction_policy
+        self.memory_size = memory_size
+
+        self.memory: OrderedDict[str, Any] = OrderedDict()
+        self.lock = threading.RLock()
+        self.disk: Cache | None = None
+        self.disk_pid: int | None = None
+        self.stats = dict(memory_hits=0, disk_hits=0, misses=0, writes=0)
+
+    def get_disk(self) -> Cache:
+        with self.lock:
+            if self.disk is None or self.disk_pid != os.getpid():
+                self.disk = Cache(
+                    self.directory,
+                    size_limit=self.size_limit,
+                    eviction_policy=self.eviction_policy,
+                )
+                self.disk_pid = os.getpid()
+            return self.disk
+
+    def get(self, key: str, default: Any = None, record_stats: bool = True) -> Any:
+        with self.lock:
+            if key in self.memory:
+                self.memory.move_to_end(key)
+                if record_stats:
+                    self.stats["memory_hits"] += 1
+                return self.memory[key]
+
+        value = self.get_disk().get(key, default=_MISSING)
+        with self.lock:
+            if value is _MISSING:
+                if record_stats:
+                    self.stats["misses"] += 1
+                return default
+            if record_stats:
+                self.stats["disk_hits"] += 1
+        self.remember(key, value)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self.get_disk().set(key, value)
+        with self.lock:
+            self.stats["writes"] += 1
+        self.remember(key, value)
+
+    def remember(self, key: str, value: Any) -> None:
+        if self.memory_size <= 0:
+            return
+        with self.lock:
+            self.memory[key] = value
+            self.memory.move_to_end(key)
+            while len(self.memory) > self.memory_size:
+                self.memory.popitem(last=False)
+
+    def __contains__(self, key: str) -> bool:
+        with self.lock:
+            if key in self.memory:
+                return True
+        return key in self.get_disk()
+
+    @contextmanager
+    def locked(self, key: str) -> Iterator[None]:
+        """
+        Hold a lock on key, shared by all processes using this
+        cache directory, e.g. while computing its value
+        """
+        with Lock(self.get_disk(), "lock:" + key, expire=LOCK_EXPIRE):
+            yield
+
+    def clear(self) -> None:
+        with self.lock:
+            self.memory.clear()
+        self.get_disk().clear()
+
+    def get_stats(self) -> dict[str, float]:
+        with self.lock:
+            stats = dict(self.stats)
+        n_lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        n_hits = stats["memory_hits"] + stats["disk_hits"]
+        stats["hit_rate"] = n_hits / n_lookups if n_lookups else 0.0
+        return stats
+
+
+_cache = TwoLevelCache(
+    get_cache_dir(),
+    size_limit=manim_config.cache.size_limit,
+    eviction_policy=manim_config.cache.eviction_policy,
+    memory_size=manim_config.cache.memory_size,
+)
+
+
+def get_versioned_key(key: str) -> str:
+    return f"v{CACHE_KEY_VERSION}:{key}"
+
+
+def get_cache_key(func: Callable, arguments: dict[str, Any]) -> str:
+    # Serialize arguments canonically, rather than through their repr
+    # within an f-string, so the key is independent of argument order
+    # and of whether defaults were passed explicitly
+    serialized = json.dumps(arguments, sort_keys=True, default=repr)
+    digest = hashlib.sha256(serialized.encode()).hexdigest()[:32]
+    return get_versioned_key(f"{func.__module__}.{func.__qualname__}:{digest}")
+
+
+def cache_on_disk(
+    func: Callable[..., T] | None = None,
+    *,
+    ignored_args: Iterable[str] = (),
+) -> Callable[..., T]:
+    """
+    Cache the results of func, keyed by its bound arguments except those
+    named in ignored_args, which should not affect the result. While one
+    process computes a value, others asking for the same one wait for it
+    rather than computing it again.
+    """
+    if func is None:
+        return lambda func: cache_on_disk(func, ignored_args=ignored_args)
+
+    signature = inspect.signature(func)
+    ignored_args = set(ignored_args)
+
+    def get_key(*args, **kwargs) -> str:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = {
+            name: value
+            for name, value in bound.arguments.items()
+            if name not in ignored_args
+        }
+        return get_cache_key(func, arguments)
 
-def cache_on_disk(func: Callable[..., T]) -> Callable[..., T]:
     @wraps(func)
     def wrapper(*args, **kwargs):
-        key = hash_string(f"{func.__name__}{args}{kwargs}")
-        value = _cache.get(key)
-        if value is None:
-            value = func(*args, **kwargs)
-            _cache.set(key, value)
+        key = get_key(*args, **kwargs)
+        value = _cache.get(key, _MISSING)
+        if value is _MISSING:
+            with _cache.locked(key):
+                # Another process may have stored it while we waited
+                value = _cache.get(key, _MISSING, record_stats=False)
+                if value is _MISSING:
+                    value = func(*args, **kwargs)
+                    _cache.set(key, value)
         return value
+
+    wrapper.get_cache_key = get_key
     return wrapper
 
 
+def get_cached_value(key: str) -> Any:
+    return _cache.get(get_versioned_key(key))
+
+
+def set_cached_value(key: str, value: Any) -> None:
+    _cache.set(get_versioned_key(key), value)
+
+
+def has_cached_value(key: str) -> bool:
+    return get_versioned_key(key) in _cache
+
+
+def is_cached_on_disk(func: Callable, *args, **kwargs) -> bool:
+    """
+    Whether calling a function decorated with cache_on_disk
+    with these arguments would hit the cache
+    """
+    return func.get_cache_key(*args, **kwargs) in _cache
+
+
+def save_to_disk_cache(func: Callable, value: Any, *args, **kwargs) -> None:
+    """
+    Store value as the result which a function decorated with
+    cache_on_disk returns for these arguments
+    """
+    _cache.set(func.get_cache_key(*args, **kwargs), value)
+
+
+def store_cached_file(key: str, file_path: str | Path) -> None:
+    """
+    Store a copy of the file at file_path under key. Like any other
+    entry, it counts toward the size limit and may be evicted
+    """
+    with open(file_path, "rb") as fp:
+        _cache.get_disk().set(get_versioned_key(key), fp, read=True)
+
+
+def copy_cached_file(key: str, file_path: str | Path) -> bool:
+    """
+    Copy the file stored under key to file_path, returning
+    whether there was one
+    """
+    fp = _cache.get_disk().get(get_versioned_key(key), read=True)
+    if fp is None:
+        return False
+    with fp, open(file_path, "wb") as out:
+        shutil.copyfileobj(fp, out)
+    return True
+
+
+def get_cache_stats() -> dict[str, float]:
+    return _cache.get_stats()
+
+
+def report_cache_stats() -> None:
+    stats = get_cache_stats()
+    if stats["memory_hits"] + stats["disk_hits"] + stats["misses"] == 0:
+        return
+    log.info(
+        "Cache: {memory_hits} memory hits, {disk_hits} disk hits, "
+        "{misses} misses ({hit_rate:.0%} hit rate), {writes} writes".format(**stats)
+    )
+
+
+if manim_config.cache.report_stats:
+    atexit.register(report_cache_stats)
+
+
 def clear_cache():
     _cache.clear()
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import numpy as np
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Sequence
+
+    from manimlib.mobject.mobject import Mobject
+
+
+class DataArena(object):
+    """
+    A growable buffer holding the data arrays of several mobjects back to
+    back, with each mobject's data replaced by a view into it. Consecutive
+    members can then be read out as a single contiguous slice, with no
+    concatenation.
+
+    If a member's data gets replaced, e.g. when its number of points
+    changes, the arena no longer holds it, and everything is packed again.
+    """
+    growth_factor: float = 1.5
+
+    def __init__(self, dtype: np.dtype):
+        self.buffer = np.zeros(0, dtype=dtype)
+        self.members: list[Mobject] = []
+        self.views: list[np.ndarray] = []
+        self.offsets = np.zeros(1, dtype=int)
+        self.positions: dict[int, int] = dict()
+        # Maps spans of rows to the shader vertex indices of the members
+        # occupying them, as rows of the buffer, or None if there are none.
+        # Cleared whenever a member notes a change to its data.
+        self.index_cache: dict[tuple[int, int], np.ndarray | None] = dict()
+        # Incremented each time members are moved
+        self.version = 0
+
+    def holds(self, members: Sequence[Mobject]) -> bool:
+        return len(members) == len(self.members) and all(
+            mob is member and mob.data is view
+            for mob, member, view in zip(members, self.members, self.views)
+        )
+
+    def pack(self, members: Sequence[Mobject]) -> None:
+        lengths = [len(mob.data) for mob in members]
+        total = sum(lengths)
+        capacity = len(self.buffer)
+        if total > capacity:
+            capacity = int(self.growth_factor * total)
+        # Always copy into a fresh buffer, since current data may
+        # be views into the old one at overlapping positions
+        buffer = np.zeros(capacity, dtype=self.buffer.dtype)
+        self.offsets = np.zeros(len(members) + 1, dtype=int)
+        self.offsets[1:] = np.cumsum(lengths)
+        self.views = []
+        for mob, start, end in zip(members, self.offsets[:-1], self.offsets[1:]):
+            buffer[start:end] = mob.data
+            mob.data = buffer[start:end]
+            mob.data_arena = self
+            self.views.append(mob.data)
+        member_ids = set(map(id, members))
+        for mob in self.members:
+            if id(mob) not in member_ids and mob.data_arena is self:
+                mob.data = mob.data.copy()
+                mob.data_arena = None
+        self.buffer = buffer
+        self.members = list(members)
+        self.positions = {id(mob): n for n, mob in enumerate(members)}
+        self.index_cache = dict()
+        self.version += 1
+
+    def release(self) -> None:
+        """
+        Give each member its own copy of its data again
+        """
+        for mob in self.members:
+            if mob.data_arena is self:
+                mob.data = mob.data.copy()
+                mob.data_arena = None
+        self.members = []
+        self.views = []
+        self.positions = dict()
+        self.index_cache = dict()
+        self.version += 1
+
+    def clear_index_cache(self) -> None:
+        if self.index_cache:
+            self.index_cache = dict()
+
+    def get_span(self, members: Sequence[Mobject]) -> tuple[int, int] | None:
+        """
+        If members are held consecutively, in order, return the
+        start and end rows of the buffer they occupy
+        """
+        first = self.positions.get(id(members[0]))
+        if first is None:
+            return None
+        last = first + len(members)
+        if last > len(self.members):
+            return None
+        if any(mob is not member for mob, member in zip(members, self.members[first:last])):
+            return None
+        return int(self.offsets[first]), int(self.offsets[last])
+
+    def get_shader_data(self, members: Sequence[Mobject]) -> np.ndarray | None:
+        """
+        Equivalent to concatenating the shader data of members, provided
+        they are held consecutively, in which case this is either a slice
+        of the buffer or a single gather from it. Otherwise returns None.
+        """
+        span = self.get_span(members)
+        if span is None:
+            return None
+        for mob in members:
+            mob.refresh_shader_data()
+
+        if span not in self.index_cache:
+            index_lists = [mob.get_shader_vert_indices() for mob in members]
+            if all(indices is None for indices in index_lists):
+                self.index_cache[span] = None
+            else:
+                self.index_cache[span] = np.hstack([
+                    offset + (np.arange(len(mob.data)) if indices is None else indices)
+                    for mob, indices, offset in zip(
+                        members, index_lists,
+                        self.offsets[self.positions[id(members[0])]:],
+                    )
+                ]).astype(int)
+        indices = self.index_cache[span]
+        if indices is None:
+            return self.buffer[span[0]:span[1]]
+        return self.buffer[indices]
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import hashlib
+import numbers
+import types
+
+import numpy as np
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+def update_hash(hasher: Any, value: Any, depth: int = 3, seen: set[int] | None = None) -> None:
+    """
+    Feed a deterministic description of value into hasher, e.g. one from hashlib.
+
+    Mobjects contribute their type, data, uniforms and updaters, numpy arrays
+    their raw bytes, functions their compiled code, closure values and the
+    module-level globals they refer to, and animations their type and
+    attributes. Objects of any other type only contribute their type name,
+    and containers are only followed down to the given depth.
+
+    In particular, state held in attributes of other objects, or in class
+    attributes, is not seen, so a function reading such state hashes the
+    same after that state changes.
+    """
+    from manimlib.animation.animation import Animation
+    from manimlib.mobject.mobject import Mobject
+
+    if seen is None:
+        seen = set()
+
+    if value is None or isinstance(value, (bool, numbers.Number, str, bytes)):
+        hasher.update(repr(value).encode())
+        return
+    if isinstance(value, np.ndarray):
+        hasher.update(str((value.dtype, value.shape)).encode())
+        hasher.update(np.ascontiguousarray(value).tobytes())
+        return
+
+    if id(value) in seen or depth < 0:
+        hasher.update(type(value).__qualname__.encode())
+        return
+    seen.add(id(value))
+
+    if isinstance(value, Mobject):
+        for mob in value.get_family():
+            hasher.update(type(mob).__qualname__.encode())
+            update_hash(hasher, mob.data)
+            for key in sorted(mob.uniforms):
+                hasher.update(key.encode())
+                update_hash(hasher, mob.uniforms[key])
+            update_hash(hasher, (mob.shader_folder, mob.z_index, mob.depth_test), depth)
+            update_hash(hasher, mob.texture_paths, depth)
+            update_hash(hasher, mob.get_updaters(), depth - 1, seen)
+    elif isinstance(value, Animation):
+        hasher.update(type(value).__qualname__.encode())
+        update_hash(hasher, vars(value), depth - 1, seen)
+    elif isinstance(value, dict):
+        for key in sorted(value, key=repr):
+            hasher.update(repr(key).encode())
+            update_hash(hasher, value[key], depth - 1, seen)
+    elif isinstance(value, (list, tuple)):
+        hasher.update(type(value).__qualname__.encode())
+        for item in value:
+            update_hash(hasher, item, depth - 1, seen)
+    elif isinstance(value, (set, frozenset)):
+        # Iteration order, and the repr of many objects, vary between
+        # processes, so combine the hashes of the items in sorted order
+        hasher.update(type(value).__qualname__.encode())
+        item_digests = []
+        for item in value:
+            item_hasher = hashlib.sha256()
+            update_hash(item_hasher, item, depth - 1, set(seen))
+            item_digests.append(item_hasher.digest())
+        for digest in sorted(item_digests):
+            hasher.update(digest)
+    elif isinstance(value, types.MethodType):
+        update_hash(hasher, value.__func__, depth, seen)
+        update_hash(hasher, value.__self__, depth - 1, seen)
+    elif isinstance(value, types.FunctionType):
+        hasher.update(value.__qualname__.encode())
+        update_code_hash(hasher, value.__code__)
+        for cell in value.__closure__ or ():
+            try:
+                update_hash(hasher, cell.cell_contents, depth - 1, seen)
+            except ValueError:
+                # Empty cell
+                pass
+        update_hash(hasher, value.__defaults__, depth - 1, seen)
+        # Helper functions and constants the function refers to by name
+        global_values = value.__globals__
+        for name in get_code_names(value.__code__):
+            if name in global_values:
+                hasher.update(name.encode())
+                update_hash(hasher, global_values[name], depth - 1, seen)
+    else:
+        hasher.update(type(value).__qualname__.encode())
+
+
+def update_code_hash(hasher: Any, code: types.CodeType) -> None:
+    hasher.update(code.co_code)
+    hasher.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        # Nested code objects (e.g. lambdas) have an address in their repr
+        if isinstance(const, types.CodeType):
+            update_code_hash(hasher, const)
+        else:
+            hasher.update(repr(const).encode())
+
+
+def get_code_names(code: types.CodeType) -> list[str]:
+    """
+    Names of globals and attributes referred to in code, and in
+    the code of any functions defined within it
+    """
+    names = list(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names.extend(get_code_names(const))
+    return sorted(set(names))
+
+
+def hash_values(*values: Any, n_bytes: int = 16) -> str:
+    hasher = hashlib.sha256()
+    for value in values:
+        update_hash(hasher, value)
+    return hasher.hexdigest()[:n_bytes]
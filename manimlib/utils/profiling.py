@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import nullcontext
+from pathlib import Path
+
+from manimlib.config import manim_config
+from manimlib.logger import log
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, ContextManager
+
+
+_NULL_CONTEXT = nullcontext()
+
+
+class ProfiledSection(object):
+    def __init__(self, profiler: RenderProfiler, name: str, category: str = "stage"):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.record(self.name, self.category, self.start, time.perf_counter() - self.start)
+
+
+class RenderProfiler(object):
+    """
+    Collects how long each stage of the render loop takes, per frame
+    and per play, along with counters such as the number of bytes
+    written to vertex buffers.
+
+    When disabled, section, frame and play return a shared null
+    context, so instrumented code pays only for a method call.
+    """
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.reset()
+
+    def reset(self) -> None:
+        self.origin = time.perf_counter()
+        self.events: list[dict[str, Any]] = []
+        self.stage_totals: dict[str, float] = defaultdict(float)
+        self.stage_calls: dict[str, int] = defaultdict(int)
+        self.counter_totals: dict[str, float] = defaultdict(float)
+        self.counter_maxima: dict[str, float] = defaultdict(float)
+        self.frame_times: list[float] = []
+        self.frame_counters: dict[str, float] | None = None
+        self.plays: list[dict[str, Any]] = []
+        self.play_stages: dict[str, float] | None = None
+        self.play_n_frames = 0
+
+    def section(self, name: str) -> ContextManager:
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return ProfiledSection(self, name)
+
+    def frame(self) -> ContextManager:
+        if not self.enabled:
+            return _NULL_CONTEXT
+        self.frame_counters = defaultdict(float)
+        return ProfiledSection(self, "frame", "frame")
+
+    def play(self, name: str) -> ContextManager:
+        if not self.enabled:
+            return _NULL_CONTEXT
+        self.play_stages = defaultdict(float)
+        self.play_n_frames = 0
+        return ProfiledSection(self, name, "play")
+
+    def count(self, name: str, amount: float = 1) -> None:
+        if not self.enabled:
+            return
+        self.counter_totals[name] += amount
+        if self.frame_counters is not None:
+            self.frame_counters[name] += amount
+
+    def record(self, name: str, category: str, start: float, duration: float) -> None:
+        self.events.append(dict(
+            name=name,
+            cat=category,
+            ph="X",
+            ts=1e6 * (start - self.origin),
+            dur=1e6 * duration,
+            pid=os.getpid(),
+            tid=threading.get_ident(),
+        ))
+        if category == "stage":
+            self.stage_totals[name] += duration
+            self.stage_calls[name] += 1
+            if self.play_stages is not None:
+                self.play_stages[name] += duration
+        elif category == "frame":
+            self.end_frame(start + duration, duration)
+        elif category == "play":
+            self.plays.append(dict(
+                name=name,
+                duration=duration,
+                n_frames=self.play_n_frames,
+                stages=dict(self.play_stages or {}),
+            ))
+            self.play_stages = None
+
+    def end_frame(self, end: float, duration: float) -> None:
+        self.frame_times.append(duration)
+        self.play_n_frames += 1
+        for name, value in self.frame_counters.items():
+            self.counter_maxima[name] = max(self.counter_maxima[name], value)
+            # Counter events draw as a track beneath the timeline
+            self.events.append(dict(
+                name=name,
+                ph="C",
+                ts=1e6 * (end - self.origin),
+                pid=os.getpid(),
+                args={name: value},
+            ))
+        self.frame_counters = None
+
+    def get_summary(self) -> dict[str, Any]:
+        n_frames = max(len(self.frame_times), 1)
+        total_frame_time = sum(self.frame_times)
+        return dict(
+            n_frames=len(self.frame_times),
+            total_frame_time=total_frame_time,
+            stages={
+                name: dict(
+                    total=total,
+                    calls=self.stage_calls[name],
+                    per_frame=total / n_frames,
+                    fraction=total / total_frame_time if total_frame_time else 0.0,
+                )
+                for name, total in self.stage_totals.items()
+            },
+            counters={
+                name: dict(
+                    total=total,
+                    per_frame=total / n_frames,
+                    max_per_frame=self.counter_maxima[name],
+                )
+                for name, total in self.counter_totals.items()
+            },
+            plays=self.plays,
+        )
+
+    def get_summary_table(self, summary: dict[str, Any], max_plays: int = 10) -> str:
+        lines = [
+            f"{summary['n_frames']} frames in {summary['total_frame_time']:.2f}s",
+            f"{'Stage':<28}{'Total (s)':>12}{'ms/frame':>12}{'Calls':>10}{'% frame':>10}",
+        ]
+        stages = sorted(summary["stages"].items(), key=lambda item: -item[1]["total"])
+        for name, stats in stages:
+            lines.append(
+                f"{name:<28}{stats['total']:>12.3f}{1000 * stats['per_frame']:>12.2f}"
+                f"{stats['calls']:>10}{100 * stats['fraction']:>9.1f}%"
+            )
+        if summary["counters"]:
+            lines.append(f"{'Counter':<28}{'Total':>12}{'Per frame':>12}{'Max':>10}")
+            for name, stats in sorted(summary["counters"].items()):
+                lines.append(
+                    f"{name:<28}{stats['total']:>12.0f}{stats['per_frame']:>12.1f}"
+                    f"{stats['max_per_frame']:>10.0f}"
+                )
+        if summary["plays"]:
+            lines.append(f"{'Slowest plays':<40}{'Frames':>10}{'Time (s)':>12}{'ms/frame':>12}")
+            plays = sorted(summary["plays"], key=lambda play: -play["duration"])
+            for play in plays[:max_plays]:
+                per_frame = 1000 * play["duration"] / max(play["n_frames"], 1)
+                lines.append(
+                    f"{play['name'][:38]:<40}{play['n_frames']:>10}"
+                    f"{play['duration']:>12.3f}{per_frame:>12.2f}"
+                )
+        return "\n".join(lines)
+
+    def write_report(self, name: str, directory: str) -> str:
+        """
+        Log a summary table, and write a timeline of all recorded events
+        in the Chrome trace format, viewable in chrome://tracing or
+        ui.perfetto.dev, together with the same summary. Returns the
+        path of the trace, and resets the profiler for a new run.
+        """
+        # Imported here, since file_ops imports back through the
+        # modules which use this one
+        from manimlib.utils.file_ops import guarantee_existence
+
+        summary = self.get_summary()
+        log.info(f"Render profile of {name}\n" + self.get_summary_table(summary))
+
+        path = Path(guarantee_existence(directory), f"{name}_profile.json")
+        with open(path, "w") as fp:
+            json.dump(dict(
+                traceEvents=self.events,
+                displayTimeUnit="ms",
+                summary=summary,
+            ), fp)
+        log.info(f"Render timeline written to {path}")
+        self.reset()
+        return str(path)
+
+
+profiler = RenderProfiler(enabled=manim_config.profiling.enabled)
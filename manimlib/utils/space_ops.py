@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from functools import reduce
 import math
-import operator as op
 import platform
 
 from mapbox_earcut import triangulate_float32 as earcut
@@ -12,14 +10,13 @@ from tqdm.auto import tqdm as ProgressDisplay
 
 from manimlib.constants import DOWN, OUT, RIGHT, UP
 from manimlib.constants import PI, TAU
-from manimlib.utils.iterables import adjacent_pairs
 from manimlib.utils.simple_functions import clip
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import Callable, Sequence, List, Tuple
-    from manimlib.typing import Vect2, Vect3, Vect4, VectN, Matrix3x3, Vect3Array, Vect2Array
+    from manimlib.typing import Vect2, Vect3, Vect4, VectN, Matrix3x3, Vect3Array, Vect2Array, VectNArray
 
 
 def cross(
@@ -72,6 +69,35 @@ def poly_line_length(points):
     diffs = points[1:] - points[:-1]
     return np.sqrt((diffs**2).sum(1)).sum()
 
+
+def simplify_poly_line(points: VectNArray, tolerance: float) -> np.ndarray:
+    """
+    Return the indices of the points kept by Ramer-Douglas-Peucker
+    simplification, such that the poly line through those points stays
+    within tolerance of each point left out. The ends are always kept.
+    """
+    n_points = len(points)
+    keep = np.zeros(n_points, dtype=bool)
+    keep[[0, -1]] = True
+    to_process = [(0, n_points - 1)]
+    while to_process:
+        i, j = to_process.pop()
+        if j - i < 2:
+            continue
+        start, end = points[i], points[j]
+        chord = end - start
+        vects = points[i + 1:j] - start
+        # Distance to the segment, not the line, in case
+        # the poly line doubles back past either end
+        alphas = np.clip(vects @ chord / max((chord**2).sum(), 1e-300), 0, 1)
+        dists = np.linalg.norm(vects - alphas[:, np.newaxis] * chord, axis=1)
+        k = int(np.argmax(dists))
+        if dists[k] > tolerance:
+            k += i + 1
+            keep[k] = True
+            to_process.extend([(i, k), (k, j)])
+    return np.flatnonzero(keep)
+
 # Operations related to rotation
 
 
@@ -369,12 +395,14 @@ def get_closest_point_on_line(a: VectN, b: VectN, p: VectN) -> VectN:
 
 
 def get_winding_number(points: Sequence[Vect2 | Vect3]) -> float:
-    total_angle = 0
-    for p1, p2 in adjacent_pairs(points):
-        d_angle = angle_of_vector(p2) - angle_of_vector(p1)
-        d_angle = ((d_angle + PI) % TAU) - PI
-        total_angle += d_angle
-    return total_angle / TAU
+    if len(points) == 0:
+        return 0
+    points = np.asarray(points)
+    angles = np.arctan2(points[:, 1], points[:, 0])
+    # Angle changes between adjacent pairs, including last to first
+    d_angles = np.roll(angles, -1) - angles
+    d_angles = ((d_angles + PI) % TAU) - PI
+    return float(d_angles.sum() / TAU)
 
 
 ##
@@ -420,9 +448,9 @@ def norm_squared(v: VectN | List[float]) -> float:
 
 
 # TODO, fails for polygons drawn over themselves
-def earclip_triangulation(verts: Vect3Array | Vect2Array, ring_ends: list[int]) -> list[int]:
+def earclip_triangulation(verts: Vect3Array | Vect2Array, ring_ends: list[int]) -> np.ndarray:
     """
-    Returns a list of indices giving a triangulation
+    Returns an array of indices giving a triangulation
     of a polygon, potentially with holes
 
     - verts is a numpy array of points
@@ -430,79 +458,89 @@ def earclip_triangulation(verts: Vect3Array | Vect2Array, ring_ends: list[int])
     - ring_ends is a list of indices indicating where
     the ends of new paths are
     """
-
-    rings = [
-        list(range(e0, e1))
-        for e0, e1 in zip([0, *ring_ends], ring_ends)
-    ]
+    ring_ends = np.array(ring_ends, dtype=int)
+    if len(ring_ends) == 0:
+        return np.zeros(0, dtype=int)
+    ring_starts = np.array([0, *ring_ends[:-1]], dtype=int)
+    n_rings = len(ring_ends)
     epsilon = 1e-6
 
-    def is_in(point, ring_id):
-        return abs(abs(get_winding_number([i - point for i in verts[rings[ring_id]]])) - 1) < epsilon
-
-    def ring_area(ring_id):
-        ring = rings[ring_id]
-        s = 0
-        for i, j in zip(ring[1:], ring):
-            s += cross2d(verts[i], verts[j])
-        return abs(s) / 2
-
     # Points at the same position may cause problems
-    for i in rings:
-        if len(i) < 2:
-            continue
-        verts[i[0]] += (verts[i[1]] - verts[i[0]]) * epsilon
-        verts[i[-1]] += (verts[i[-2]] - verts[i[-1]]) * epsilon
-
-    # First, we should know which rings are directly contained in it for each ring
-
-    right = [max(verts[rings[i], 0]) for i in range(len(rings))]
-    left = [min(verts[rings[i], 0]) for i in range(len(rings))]
-    top = [max(verts[rings[i], 1]) for i in range(len(rings))]
-    bottom = [min(verts[rings[i], 1]) for i in range(len(rings))]
-    area = [ring_area(i) for i in range(len(rings))]
+    long_rings = (ring_ends - ring_starts) >= 2
+    firsts = ring_starts[long_rings]
+    lasts = ring_ends[long_rings] - 1
+    verts[firsts] += (verts[firsts + 1] - verts[firsts]) * epsilon
+    verts[lasts] += (verts[lasts - 1] - verts[lasts]) * epsilon
+
+    # Bounding boxes and areas of all rings
+    ring_verts = verts[:ring_ends[-1]]
+    left = np.minimum.reduceat(ring_verts[:, 0], ring_starts)
+    right = np.maximum.reduceat(ring_verts[:, 0], ring_starts)
+    bottom = np.minimum.reduceat(ring_verts[:, 1], ring_starts)
+    top = np.maximum.reduceat(ring_verts[:, 1], ring_starts)
+    crosses = np.zeros(len(ring_verts))
+    crosses[:-1] = cross2d(ring_verts[1:], ring_verts[:-1])
+    # Ignore pairs straddling two rings
+    crosses[ring_ends - 1] = 0
+    area = np.abs(np.add.reduceat(crosses, ring_starts)) / 2
 
     # The larger ring must be outside
-    rings_sorted = list(range(len(rings)))
-    rings_sorted.sort(key=lambda x: area[x], reverse=True)
-
-    def is_in_fast(ring_a, ring_b):
-        # Whether a is in b
-        return reduce(op.and_, (
-            left[ring_b] <= left[ring_a] <= right[ring_a] <= right[ring_b],
-            bottom[ring_b] <= bottom[ring_a] <= top[ring_a] <= top[ring_b],
-            is_in(verts[rings[ring_a][0]], ring_b)
-        ))
-
-    chilren = [[] for i in rings]
+    rings_sorted = np.argsort(-area, kind="stable")
+    rank = np.empty(n_rings, dtype=int)
+    rank[rings_sorted] = np.arange(n_rings)
+
+    def is_in(point, ring_id):
+        ring = verts[ring_starts[ring_id]:ring_ends[ring_id]]
+        return abs(abs(get_winding_number(ring - point)) - 1) < epsilon
+
+    # First, we should know which ring, if any, directly contains each ring.
+    # Candidates are found with a sweep over rings sorted by left edge, so
+    # that only those starting further left have their bounding boxes checked
+    by_left = np.argsort(left, kind="stable")
+    sorted_left = left[by_left]
+    parent = np.full(n_rings, -1)
     ringenum = ProgressDisplay(
-        enumerate(rings_sorted),
-        total=len(rings),
+        rings_sorted,
+        total=n_rings,
         leave=False,
         ascii=True if platform.system() == 'Windows' else None,
         dynamic_ncols=True,
         desc="SVG Triangulation",
         delay=3,
     )
-    for idx, i in ringenum:
-        for j in rings_sorted[:idx][::-1]:
-            if is_in_fast(i, j):
-                chilren[j].append(i)
+    for i in ringenum:
+        candidates = by_left[:np.searchsorted(sorted_left, left[i], side="right")]
+        candidates = candidates[
+            (rank[candidates] < rank[i]) &
+            (right[candidates] >= right[i]) &
+            (bottom[candidates] <= bottom[i]) &
+            (top[candidates] >= top[i])
+        ]
+        # Check the smallest of the larger rings first
+        point = verts[ring_starts[i]]
+        for j in candidates[np.argsort(-rank[candidates])]:
+            if is_in(point, j):
+                parent[i] = j
                 break
 
-    res = []
-
-    # Then, we can use earcut for each part
-    used = [False] * len(rings)
+    # Then, we can use earcut for each part, made of an outer ring together
+    # with the rings directly inside it as holes. Rings inside of those
+    # holes start parts of their own.
+    is_outer = np.zeros(n_rings, dtype=bool)
+    children = [[] for i in range(n_rings)]
     for i in rings_sorted:
-        if used[i]:
-            continue
-        v = rings[i]
-        ring_ends = [len(v)]
-        for j in chilren[i]:
-            used[j] = True
-            v += rings[j]
-            ring_ends.append(len(v))
-        res += [v[i] for i in earcut(verts[v, :2], ring_ends)]
-
-    return res
+        j = parent[i]
+        is_outer[i] = (j < 0 or not is_outer[j])
+        if j >= 0:
+            children[j].append(i)
+
+    res = []
+    for i in rings_sorted[is_outer[rings_sorted]]:
+        part = [i, *children[i]]
+        v = np.hstack([np.arange(ring_starts[k], ring_ends[k]) for k in part])
+        part_ends = np.cumsum(ring_ends[part] - ring_starts[part])
+        res.append(v[earcut(verts[v, :2], part_ends)])
+
+    if not res:
+        return np.zeros(0, dtype=int)
+    return np.hstack(res)
@@ -1,20 +1,44 @@
 from __future__ import annotations
 
+import itertools as it
 import os
 import re
 import yaml
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from functools import lru_cache
 
 from pathlib import Path
 import tempfile
 
 from manimlib.utils.cache import cache_on_disk
+from manimlib.utils.cache import is_cached_on_disk
+from manimlib.utils.cache import save_to_disk_cache
 from manimlib.config import manim_config
 from manimlib.config import get_manim_dir
 from manimlib.logger import log
 from manimlib.utils.simple_functions import hash_string
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from typing import Iterator
+
+
+# When not None, latex_to_svg records uncached requests here
+# instead of compiling them, see collect_latex_requests
+_LATEX_REQUESTS: list[tuple[str, str, str, str]] | None = None
+
+# Compilations submitted to the worker pool which are still running, and
+# keyed by the arguments to full_tex_to_svg which its cache key depends on,
+# i.e. not the message. Finished ones are dropped, since full_tex_to_svg
+# has cached their results.
+_PENDING_COMPILATIONS: dict[tuple[str, str], Future[str]] = {}
+_PENDING_COMPILATIONS_LOCK = threading.Lock()
+
 
 def get_tex_template_config(template_name: str) -> dict[str, str]:
     name = template_name.replace(" ", "_").lower()
@@ -47,6 +71,85 @@ def get_full_tex(content: str, preamble: str = ""):
     )) + "\n"
 
 
+def get_full_tex_args(
+    latex: str,
+    template: str = "",
+    additional_preamble: str = "",
+    short_tex: str = "",
+    show_message_during_execution: bool = True,
+) -> tuple[str, str, str]:
+    """
+    Returns the arguments (full_tex, compiler, message) with
+    which latex_to_svg calls full_tex_to_svg
+    """
+    if show_message_during_execution:
+        message = f"Writing {(short_tex or latex)[:70]}..."
+    else:
+        message = ""
+
+    compiler, preamble = get_tex_config(template)
+    preamble = "\n".join([preamble, additional_preamble])
+    return get_full_tex(latex, preamble), compiler, message
+
+
+@lru_cache(maxsize=1)
+def get_tex_executor() -> ThreadPoolExecutor:
+    # The work happens in latex and dvisvgm subprocesses,
+    # so threads are enough to keep all cores busy
+    n_workers = manim_config.tex.get("max_compile_workers") or os.cpu_count()
+    return ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="latex")
+
+
+def submit_full_tex_to_svg(full_tex: str, compiler: str = "latex", message: str = "") -> Future[str]:
+    """
+    Starts full_tex_to_svg in the worker pool, unless the same compilation
+    is already pending, and returns its future. A later latex_to_svg call
+    with matching arguments waits on this future instead of compiling again.
+    """
+    key = (full_tex, compiler)
+    with _PENDING_COMPILATIONS_LOCK:
+        future = _PENDING_COMPILATIONS.get(key)
+        if future is not None:
+            return future
+        future = get_tex_executor().submit(full_tex_to_svg, full_tex, compiler, message)
+        _PENDING_COMPILATIONS[key] = future
+    # Outside the lock, since this runs right away if the future is done
+    future.add_done_callback(lambda future: discard_pending_compilation(key, future))
+    return future
+
+
+def discard_pending_compilation(key: tuple[str, str], future: Future[str]) -> None:
+    with _PENDING_COMPILATIONS_LOCK:
+        if _PENDING_COMPILATIONS.get(key) is future:
+            del _PENDING_COMPILATIONS[key]
+
+
+def submit_latex_to_svg(
+    latex: str,
+    template: str = "",
+    additional_preamble: str = "",
+    short_tex: str = "",
+    show_message_during_execution: bool = True,
+) -> Future[str]:
+    return submit_full_tex_to_svg(*get_full_tex_args(
+        latex, template, additional_preamble, short_tex, show_message_during_execution
+    ))
+
+
+def submit_latex_requests(requests: list[tuple[str, str, str, str]]) -> None:
+    """
+    Start compiling requests, as recorded by collect_latex_requests,
+    concurrently in the worker pool
+    """
+    for latex, preamble, compiler, message in requests:
+        submit_full_tex_to_svg(get_full_tex(latex, preamble), compiler, message)
+
+
+def get_pending_compilation(full_tex: str, compiler: str) -> Future[str] | None:
+    with _PENDING_COMPILATIONS_LOCK:
+        return _PENDING_COMPILATIONS.get((full_tex, compiler))
+
+
 @lru_cache(maxsize=128)
 def latex_to_svg(
     latex: str,
@@ -69,62 +172,183 @@ def latex_to_svg(
         LatexError: If LaTeX compilation fails
         NotImplementedError: If compiler is not supported
     """
-    if show_message_during_execution:
-        message = f"Writing {(short_tex or latex)[:70]}..."
-    else:
-        message = ""
+    if is_collecting_latex_requests():
+        record_latex_request(
+            latex, template, additional_preamble, short_tex, show_message_during_execution
+        )
+        raise DeferredLatexCompilation()
+    full_tex, compiler, message = get_full_tex_args(
+        latex, template, additional_preamble, short_tex, show_message_during_execution
+    )
+    future = get_pending_compilation(full_tex, compiler)
+    if future is not None:
+        return future.result()
+    return full_tex_to_svg(full_tex, compiler, message)
 
-    compiler, preamble = get_tex_config(template)
 
-    preamble = "\n".join([preamble, additional_preamble])
-    full_tex = get_full_tex(latex, preamble)
-    return full_tex_to_svg(full_tex, compiler, message)
+def is_collecting_latex_requests() -> bool:
+    return _LATEX_REQUESTS is not None
 
 
-@cache_on_disk
-def full_tex_to_svg(full_tex: str, compiler: str = "latex", message: str = ""):
-    if message:
-        print(message, end="\r")
+def record_latex_request(
+    latex: str,
+    template: str = "",
+    additional_preamble: str = "",
+    short_tex: str = "",
+    show_message_during_execution: bool = True,
+) -> None:
+    """
+    Within collect_latex_requests, record what latex_to_svg would compile
+    for these arguments, unless it's already in the cache
+    """
+    full_tex, compiler, message = get_full_tex_args(
+        latex, template, additional_preamble, short_tex, show_message_during_execution
+    )
+    if not is_cached_on_disk(full_tex_to_svg, full_tex, compiler, message):
+        preamble = "\n".join([get_tex_config(template)[1], additional_preamble])
+        _LATEX_REQUESTS.append((latex, preamble, compiler, message))
+
+
+@contextmanager
+def collect_latex_requests() -> Iterator[list[tuple[str, str, str, str]]]:
+    """
+    Within this context, latex_to_svg does not compile anything. Instead, it
+    records (latex, preamble, compiler, message) for each request not already
+    in the cache, and raises DeferredLatexCompilation, which callers should catch.
+    """
+    global _LATEX_REQUESTS
+    prev_requests = _LATEX_REQUESTS
+    _LATEX_REQUESTS = []
+    try:
+        yield _LATEX_REQUESTS
+    finally:
+        _LATEX_REQUESTS = prev_requests
+
+
+def get_full_multipage_tex(contents: list[str], preamble: str = "") -> str:
+    return "\n\n".join((
+        "\\documentclass[preview, multi=manimpage]{standalone}",
+        preamble,
+        "\\ifdefined\\manimpage\\else\\newenvironment{manimpage}{}{}\\fi",
+        "\\begin{document}",
+        *(
+            "\n".join(("\\begin{manimpage}", content, "\\end{manimpage}"))
+            for content in contents
+        ),
+        "\\end{document}"
+    )) + "\n"
+
+
+def compile_latex_requests(requests: list[tuple[str, str, str, str]]) -> None:
+    """
+    Compile requests, as recorded by collect_latex_requests, with one latex and
+    one dvisvgm call for each distinct (compiler, preamble) pair, and store each
+    page of the result in the cache used by full_tex_to_svg.
+    """
+    def get_group_key(request):
+        return request[2], request[1]
 
+    for (compiler, preamble), group in it.groupby(sorted(set(requests), key=get_group_key), get_group_key):
+        group = list(group)
+        contents = [latex for latex, _, _, _ in group]
+        full_tex = get_full_multipage_tex(contents, preamble)
+        try:
+            svg_strings = multipage_tex_to_svgs(full_tex, compiler)
+        except LatexError as err:
+            # Leave these to be compiled one at a time, which
+            # will point out precisely which one is at fault
+            log.warning(f"Batch compilation of {len(group)} LaTeX strings failed: {err}")
+            continue
+        if len(svg_strings) != len(group):
+            log.warning(
+                f"Batch compilation produced {len(svg_strings)} pages " + \
+                f"for {len(group)} LaTeX strings, results are discarded"
+            )
+            continue
+        for (latex, _, _, message), svg_string in zip(group, svg_strings):
+            save_to_disk_cache(
+                full_tex_to_svg, svg_string,
+                get_full_tex(latex, preamble), compiler, message
+            )
+
+
+def get_dvi_ext(compiler: str) -> str:
     if compiler == "latex":
-        dvi_ext = ".dvi"
+        return ".dvi"
     elif compiler == "xelatex":
-        dvi_ext = ".xdv"
+        return ".xdv"
     else:
         raise NotImplementedError(f"Compiler '{compiler}' is not implemented")
 
-    # Write intermediate files to a temporary directory
+
+def compile_tex_file(tex_path: Path, compiler: str) -> Path:
+    """
+    Runs the latex compiler on tex_path, writing into the same directory,
+    and returns the path of the resulting dvi (or xdv) file
+    """
+    dvi_path = tex_path.with_suffix(get_dvi_ext(compiler))
+    process = subprocess.run(
+        [
+            compiler,
+            *(['-no-pdf'] if compiler == "xelatex" else []),
+            "-interaction=batchmode",
+            "-halt-on-error",
+            f"-output-directory={tex_path.parent}",
+            tex_path
+        ],
+        capture_output=True,
+        text=True
+    )
+
+    if process.returncode != 0:
+        # Handle error
+        error_str = ""
+        log_path = tex_path.with_suffix(".log")
+        if log_path.exists():
+            content = log_path.read_text()
+            error_match = re.search(r"(?<=\n! ).*\n.*\n", content)
+            if error_match:
+                error_str = error_match.group()
+        raise LatexError(error_str or "LaTeX compilation failed")
+    return dvi_path
+
+
+def multipage_tex_to_svgs(full_tex: str, compiler: str = "latex") -> list[str]:
     with tempfile.TemporaryDirectory() as temp_dir:
         tex_path = Path(temp_dir, "working").with_suffix(".tex")
-        dvi_path = tex_path.with_suffix(dvi_ext)
-
-        # Write tex file
         tex_path.write_text(full_tex)
+        dvi_path = compile_tex_file(tex_path, compiler)
 
-        # Run latex compiler
-        process = subprocess.run(
+        # Write one svg file per page
+        subprocess.run(
             [
-                compiler,
-                *(['-no-pdf'] if compiler == "xelatex" else []),
-                "-interaction=batchmode",
-                "-halt-on-error",
-                f"-output-directory={temp_dir}",
-                tex_path
+                "dvisvgm",
+                dvi_path,
+                "-n",  # no fonts
+                "-v", "0",  # quiet
+                "--page=1-",
+                f"--output={Path(temp_dir, 'page_%5p.svg')}",
             ],
-            capture_output=True,
-            text=True
+            capture_output=True
         )
+        page_paths = sorted(Path(temp_dir).glob("page_*.svg"))
+        return [path.read_text(encoding="utf-8") for path in page_paths]
 
-        if process.returncode != 0:
-            # Handle error
-            error_str = ""
-            log_path = tex_path.with_suffix(".log")
-            if log_path.exists():
-                content = log_path.read_text()
-                error_match = re.search(r"(?<=\n! ).*\n.*\n", content)
-                if error_match:
-                    error_str = error_match.group()
-            raise LatexError(error_str or "LaTeX compilation failed")
+
+@cache_on_disk(ignored_args=["message"])
+def full_tex_to_svg(full_tex: str, compiler: str = "latex", message: str = ""):
+    if message:
+        print(message, end="\r")
+
+    # Write intermediate files to a temporary directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        tex_path = Path(temp_dir, "working").with_suffix(".tex")
+
+        # Write tex file
+        tex_path.write_text(full_tex)
+
+        # Run latex compiler
+        dvi_path = compile_tex_file(tex_path, compiler)
 
         # Run dvisvgm and capture output directly
         process = subprocess.run(
@@ -149,3 +373,7 @@ def full_tex_to_svg(full_tex: str, compiler: str = "latex", message: str = ""):
 
 class LatexError(Exception):
     pass
+
+
+class DeferredLatexCompilation(Exception):
+    pass